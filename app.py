@@ -1,15 +1,20 @@
-import os
+import subprocess
 import whisper
 from moviepy.editor import VideoFileClip, concatenate_videoclips
 import requests
 import json
-import ast
 
 # Step 1: Transcribe the Video
 def transcribe_video(video_path, model_name="base"):
     model = whisper.load_model(model_name)
     audio_path = "temp_audio.wav"
-    os.system(f"ffmpeg -i {video_path} -ar 16000 -ac 1 -b:a 64k -f mp3 {audio_path}")
+    subprocess.run(
+        ["ffmpeg", "-y", "-i", video_path, "-ar", "16000", "-ac", "1",
+         "-b:a", "64k", "-f", "mp3", audio_path],
+        check=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
     result = model.transcribe(audio_path)
     transcription = []
     for segment in result['segments']:
@@ -56,11 +61,12 @@ User query:
         "max_tokens": 1024,
         "top_p": 1,
         "stream": False,
-        "stop": None
+        "stop": None,
+        "response_format": {"type": "json_object"}
     }
     response = requests.post(url, headers=headers, json=data)
     data = response.json()["choices"][0]["message"]["content"]
-    conversations = ast.literal_eval(data)["conversations"]
+    conversations = json.loads(data)["conversations"]
     return conversations
 
 def edit_video(original_video_path, segments, output_video_path, fade_duration=0.5):
@@ -72,7 +78,7 @@ def edit_video(original_video_path, segments, output_video_path, fade_duration=0
         clip = video.subclip(start, end).fadein(fade_duration).fadeout(fade_duration)
         clips.append(clip)
     if clips:
-        final_clip = concatenate_videoclips(clips, method="compose")
+        final_clip = concatenate_videoclips(clips, method="chain")
         final_clip.write_videofile(output_video_path, codec="libx264", audio_codec="aac")
     else:
         print("No segments to include in the edited video.")
@@ -1,19 +1,29 @@
 import os
 import sys
-import json
-import ast
+import shutil
 import subprocess
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 
-import whisper
-from moviepy.editor import VideoFileClip, concatenate_videoclips
+import ctranslate2
+import numpy as np
+import orjson
+from faster_whisper import BatchedInferencePipeline, WhisperModel
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 try:
     import psutil
 except ImportError:
     psutil = None  # Optional dependency for cost monitoring
 
+# Handle reused by every resource check instead of one lookup per call
+_PROCESS = psutil.Process(os.getpid()) if psutil is not None else None
+
 # ============================================================================
 # ZERO-SECRETS ARCHITECTURE
 # ============================================================================
@@ -33,12 +43,22 @@ class Config:
     
     # Video processing
     WHISPER_MODEL = os.environ.get('WHISPER_MODEL', 'base')
+    WHISPER_CACHE_DIR = os.path.expanduser(os.environ.get('WHISPER_CACHE_DIR', '~/.cache/whisper'))
+    WHISPER_BATCH_SIZE = int(os.environ.get('WHISPER_BATCH_SIZE', 16))
+    WHISPER_VAD_MIN_SILENCE_MS = int(os.environ.get('WHISPER_VAD_MIN_SILENCE_MS', 500))
+    WHISPER_DEVICE = os.environ.get('WHISPER_DEVICE', 'auto')
+    WHISPER_COMPUTE_TYPE = os.environ.get('WHISPER_COMPUTE_TYPE', 'auto')
+    FFMPEG_MAX_PARALLEL = int(os.environ.get('FFMPEG_MAX_PARALLEL', 4))
+    FFMPEG_NICENESS = int(os.environ.get('FFMPEG_NICENESS', 10))
     VIDEO_INPUT_PATH = os.environ.get('VIDEO_INPUT_PATH', 'input_video.mp4')
     VIDEO_OUTPUT_PATH = os.environ.get('VIDEO_OUTPUT_PATH', 'edited_output.mp4')
+    FADE_DURATION = float(os.environ.get('FADE_DURATION', 0.5))
     
     # API integration (safe defaults)
     GROQ_API_KEY = os.environ.get('GROQ_API_KEY', 'stub-key')
     GROQ_API_URL = os.environ.get('GROQ_API_URL', 'https://api.groq.com/openai/v1/chat/completions')
+    GROQ_MAX_PARALLEL = int(os.environ.get('GROQ_MAX_PARALLEL', 4))
+    TRANSCRIPT_WINDOW_SEGMENTS = int(os.environ.get('TRANSCRIPT_WINDOW_SEGMENTS', 200))
     
     # Cost protection
     ENABLE_COST_MONITORING = os.environ.get('ENABLE_COST_MONITORING', 'true').lower() == 'true'
@@ -56,6 +76,57 @@ class Config:
         return Config.GROQ_API_KEY and Config.GROQ_API_KEY not in ['groq-key', 'stub-key'] and not Config.GROQ_API_KEY.startswith('placeholder')
 
 
+# Every ffmpeg child holds a slot, so parallel stages can never spawn more
+# encoders than the free tier's memory budget allows
+FFMPEG_PARALLELISM = max(1, min(os.cpu_count() or 1, Config.FFMPEG_MAX_PARALLEL))
+FFMPEG_SEMAPHORE = threading.BoundedSemaphore(FFMPEG_PARALLELISM)
+
+RULE = "=" * 70
+
+
+def write_block(*lines):
+    """Write a multi-line banner with one stdout write and flush"""
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+def run_ffmpeg(args, text=True):
+    """Run ffmpeg with bounded concurrency and below-normal priority"""
+    command = ["ffmpeg", *args]
+    kwargs = {}
+    
+    if os.name == 'nt':
+        kwargs['creationflags'] = subprocess.BELOW_NORMAL_PRIORITY_CLASS
+    elif Config.FFMPEG_NICENESS and shutil.which("nice"):
+        # nice(1) instead of preexec_fn, which is unsafe to use from threads
+        command = ["nice", "-n", str(Config.FFMPEG_NICENESS), *command]
+    
+    with FFMPEG_SEMAPHORE:
+        return subprocess.run(command, check=True, capture_output=True, text=text, **kwargs)
+
+
+def _build_groq_session():
+    """Create a pooled, retrying HTTP session for Groq API calls"""
+    session = requests.Session()
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset(["POST"]),
+        raise_on_status=False,
+    )
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry))
+    session.headers.update({
+        "Content-Type": "application/json",
+        "Authorization": f"Bearer {Config.GROQ_API_KEY}"
+    })
+    return session
+
+
+# Reused across calls so repeat requests skip the TCP + TLS handshake
+GROQ_SESSION = _build_groq_session()
+
+
 class CostMonitor:
     """Monitor resource usage and trigger maintenance mode if needed"""
     
@@ -72,8 +143,9 @@ class CostMonitor:
             # In production, this would query actual Railway/platform metrics
             # For now, we'll implement a simple file-based check
             
-            # Get current memory usage
-            memory_mb = psutil.Process(os.getpid()).memory_info().rss / 1024 / 1024
+            # Get current memory usage (oneshot batches the /proc reads)
+            with _PROCESS.oneshot():
+                memory_mb = _PROCESS.memory_info().rss / 1024 / 1024
             
             if memory_mb > Config.FREE_TIER_LIMIT_MB:
                 return False, f"Memory usage {memory_mb:.0f}MB exceeds limit {Config.FREE_TIER_LIMIT_MB}MB"
@@ -87,14 +159,16 @@ class CostMonitor:
     @staticmethod
     def trigger_maintenance_mode():
         """Activate maintenance mode and prepare for migration"""
-        print("\n" + "="*70)
-        print("⚠️  MAINTENANCE MODE TRIGGERED")
-        print("="*70)
-        print(f"Timestamp: {datetime.now().isoformat()}")
-        print(f"Reason: Free tier limit exceeded")
-        print(f"Action: Deploying maintenance page")
-        print(f"Next: Migration to Coolify recommended")
-        print("="*70 + "\n")
+        write_block(
+            "", RULE,
+            "⚠️  MAINTENANCE MODE TRIGGERED",
+            RULE,
+            f"Timestamp: {datetime.now().isoformat()}",
+            "Reason: Free tier limit exceeded",
+            "Action: Deploying maintenance page",
+            "Next: Migration to Coolify recommended",
+            RULE, "",
+        )
         
         # Log to file for monitoring
         with open('maintenance_mode.log', 'a') as f:
@@ -111,31 +185,96 @@ class CostMonitor:
         print("🔧 Support docs: COOLIFY_SUPPORT.md")
 
 
+def resolve_whisper_device():
+    """Pick the inference device and quantized compute type for Whisper"""
+    device = Config.WHISPER_DEVICE
+    if device == 'auto':
+        device = 'cuda' if ctranslate2.get_cuda_device_count() > 0 else 'cpu'
+    
+    compute_type = Config.WHISPER_COMPUTE_TYPE
+    if compute_type == 'auto':
+        # int8 weights: ~4x smaller than FP32, fits the free-tier memory budget
+        compute_type = 'int8_float16' if device == 'cuda' else 'int8'
+    
+    return device, compute_type
+
+
+@lru_cache(maxsize=2)
+def load_whisper_model(model_name):
+    """Load a Whisper model once per process; weights persist in WHISPER_CACHE_DIR
+    
+    model_name is a size ("base") or a directory of CTranslate2-converted weights.
+    """
+    device, compute_type = resolve_whisper_device()
+    print(f"📦 Loading Whisper model: {model_name} ({device}, {compute_type})")
+    return WhisperModel(
+        model_name, device=device, compute_type=compute_type, download_root=Config.WHISPER_CACHE_DIR
+    )
+
+
+def warm_whisper_model(model_name):
+    """Load the model and run one second of silence through it"""
+    model = load_whisper_model(model_name)
+    # VAD would skip pure silence, so disable it to actually exercise the kernels
+    segments, _info = model.transcribe(np.zeros(16000, dtype=np.float32), beam_size=1, vad_filter=False)
+    for _segment in segments:
+        pass
+    return model
+
+
+def extract_audio(video_path, sample_rate=16000):
+    """Decode the audio track to mono float32 PCM through an ffmpeg pipe"""
+    # Raw s16le on stdout: no temp file, no MP3 encode, and decoding runs in
+    # the niced ffmpeg child rather than on this process's GIL
+    result = run_ffmpeg([
+        "-loglevel", "error", "-i", video_path,
+        "-vn", "-ac", "1", "-ar", str(sample_rate),
+        "-f", "s16le", "-"
+    ], text=False)
+    return np.frombuffer(result.stdout, np.int16).astype(np.float32) / 32768.0
+
+
 def transcribe_video(video_path, model_name="base"):
-    """Transcribe video using Whisper"""
+    """Transcribe video using faster-whisper (CTranslate2)"""
     print(f"🎙️  Transcribing video with Whisper model: {model_name}")
     
-    model = whisper.load_model(model_name)
-    audio_path = "temp_audio.wav"
+    model = load_whisper_model(model_name)
+    
+    # Silero VAD drops silent ranges before they reach the encoder; the
+    # returned segment timestamps are mapped back onto the original timeline,
+    # so get_relevant_segments and edit_video see real source offsets
+    transcribe_options = {
+        'beam_size': 1,
+        'vad_filter': True,
+        'vad_parameters': {'min_silence_duration_ms': Config.WHISPER_VAD_MIN_SILENCE_MS},
+    }
+    
+    audio = extract_audio(video_path)
+    
+    segments = None
+    if Config.WHISPER_BATCH_SIZE > 1:
+        try:
+            pipeline = BatchedInferencePipeline(model=model)
+            segments, _info = pipeline.transcribe(
+                audio, batch_size=Config.WHISPER_BATCH_SIZE, **transcribe_options
+            )
+            # transcribe() returns a lazy generator; decoding (and its errors)
+            # happens on iteration, so consume it while the fallback can still run
+            segments = list(segments)
+        except Exception as e:
+            segments = None
+            print(f"⚠️  Batched transcription unavailable, falling back to sequential: {str(e)}")
+    
+    if segments is None:
+        segments, _info = model.transcribe(audio, **transcribe_options)
     
-    # Extract audio using ffmpeg (secure subprocess call)
-    try:
-        subprocess.run([
-            "ffmpeg", "-i", video_path, "-ar", "16000", "-ac", "1",
-            "-b:a", "64k", "-f", "mp3", audio_path, "-y"
-        ], check=True, capture_output=True, text=True)
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  FFmpeg warning: {e.stderr}")
-        # Continue even if ffmpeg shows warnings
-    
-    result = model.transcribe(audio_path)
     transcription = []
     
-    for segment in result['segments']:
+    for segment in segments:
         transcription.append({
-            'start': segment['start'],
-            'end': segment['end'],
-            'text': segment['text'].strip()
+            'start': segment.start,
+            'end': segment.end,
+            'text': segment.text.strip()
         })
     
     print(f"✅ Transcription complete: {len(transcription)} segments")
@@ -147,14 +286,16 @@ def get_relevant_segments_stubbed(transcript, user_query):
     STUBBED VERSION: Return mock segments without calling external API
     This is used when GROQ_API_KEY is not configured
     """
-    print("\n" + "="*70)
-    print("⚠️  STUB MODE: Using mock AI responses (GROQ_API_KEY not configured)")
-    print("="*70)
-    print("To enable real AI processing:")
-    print("1. Get API key from: https://console.groq.com/keys")
-    print("2. Set environment variable: GROQ_API_KEY=gsk_your_key_here")
-    print("3. Redeploy application")
-    print("="*70 + "\n")
+    write_block(
+        "", RULE,
+        "⚠️  STUB MODE: Using mock AI responses (GROQ_API_KEY not configured)",
+        RULE,
+        "To enable real AI processing:",
+        "1. Get API key from: https://console.groq.com/keys",
+        "2. Set environment variable: GROQ_API_KEY=gsk_your_key_here",
+        "3. Redeploy application",
+        RULE, "",
+    )
     
     # Return mock segments based on transcript length
     # In a real stub, we might use simple keyword matching
@@ -180,17 +321,9 @@ def get_relevant_segments_stubbed(transcript, user_query):
     return mock_conversations
 
 
-def get_relevant_segments(transcript, user_query):
-    """Get relevant segments using Groq API (or stub if not configured)"""
-    
-    # Check if API is configured
-    if not Config.is_api_configured():
-        return get_relevant_segments_stubbed(transcript, user_query)
-    
-    # Real API call
-    print(f"🤖 Calling Groq API for AI-powered segment selection")
-    
-    prompt = f"""You are an expert video editor who can read video transcripts and perform video editing. Given a transcript with segments, your task is to identify all the conversations related to a user query. Follow these guidelines when choosing conversations. A group of continuous segments in the transcript is a conversation.
+def _build_segments_prompt(transcript, user_query):
+    """Build the segment-selection prompt for one transcript window"""
+    return f"""You are an expert video editor who can read video transcripts and perform video editing. Given a transcript with segments, your task is to identify all the conversations related to a user query. Follow these guidelines when choosing conversations. A group of continuous segments in the transcript is a conversation.
 
 Guidelines:
 1. The conversation should be relevant to the user query. The conversation should include more than one segment to provide context and continuity.
@@ -200,24 +333,22 @@ Guidelines:
 5. Match the start and end time of the conversations using the segment timestamps from the transcript.
 6. The conversations should be a direct part of the video and should not be out of context.
 
-Output format: {{ "conversations": [{{"start": "s1", "end": "e1"}}, {{"start": "s2", "end": "e2"}}] }}
+Output format (JSON object): {{ "conversations": [{{"start": "s1", "end": "e1"}}, {{"start": "s2", "end": "e2"}}] }}
 
 Transcript:
-{transcript}
+{orjson.dumps(transcript).decode()}
 
 User query:
 {user_query}"""
 
-    headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {Config.GROQ_API_KEY}"
-    }
 
+def _query_segments_window(transcript, user_query):
+    """Ask Groq for the relevant conversations inside one transcript window"""
     data = {
         "messages": [
             {
                 "role": "system",
-                "content": prompt
+                "content": _build_segments_prompt(transcript, user_query)
             }
         ],
         "model": "llama-3.1-70b-versatile",
@@ -225,15 +356,40 @@ User query:
         "max_tokens": 1024,
         "top_p": 1,
         "stream": False,
-        "stop": None
+        "stop": None,
+        "response_format": {"type": "json_object"}
     }
     
+    response = GROQ_SESSION.post(Config.GROQ_API_URL, json=data, timeout=30)
+    response.raise_for_status()
+    
+    # JSON mode puts the object directly in message.content
+    response_data = response.json()["choices"][0]["message"]["content"]
+    return orjson.loads(response_data)["conversations"]
+
+
+def get_relevant_segments(transcript, user_query):
+    """Get relevant segments using Groq API (or stub if not configured)"""
+    
+    # Check if API is configured
+    if not Config.is_api_configured():
+        return get_relevant_segments_stubbed(transcript, user_query)
+    
+    # Real API call
+    print(f"🤖 Calling Groq API for AI-powered segment selection")
+    
+    # Long transcripts are split into windows queried concurrently, which
+    # bounds prompt size per request and overlaps the LLM round-trips
+    window = max(1, Config.TRANSCRIPT_WINDOW_SEGMENTS)
+    windows = [transcript[i:i + window] for i in range(0, len(transcript), window)]
+    if not windows:
+        return []
+    
     try:
-        response = requests.post(Config.GROQ_API_URL, headers=headers, json=data, timeout=30)
-        response.raise_for_status()
-        
-        response_data = response.json()["choices"][0]["message"]["content"]
-        conversations = ast.literal_eval(response_data)["conversations"]
+        max_workers = min(len(windows), max(1, Config.GROQ_MAX_PARALLEL))
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [pool.submit(_query_segments_window, chunk, user_query) for chunk in windows]
+            conversations = [conversation for future in futures for conversation in future.result()]
         
         print(f"✅ AI processing complete: {len(conversations)} conversations found")
         return conversations
@@ -248,37 +404,92 @@ User query:
         return get_relevant_segments_stubbed(transcript, user_query)
 
 
+def _to_seconds(value):
+    """Convert a segment timestamp (seconds or [HH:]MM:SS string) to seconds"""
+    if isinstance(value, str) and ':' in value:
+        seconds = 0.0
+        for part in value.split(':'):
+            seconds = seconds * 60 + float(part)
+        return seconds
+    return float(value)
+
+
+def _extract_clip(video_path, start, end, clip_path, fade_duration):
+    """Cut one segment into its own file, with per-clip fades when requested
+
+    Clips are always re-encoded, fades or not. A stream copy has to start on
+    the keyframe before `start` and relies on the MP4 edit list to hide that
+    pre-roll, which the concat demuxer ignores: the joined video then replays
+    every pre-roll and its timestamps go backwards.
+    """
+    duration = end - start
+    filters = []
+    if fade_duration > 0:
+        fade_out_start = max(duration - fade_duration, 0)
+        video_fades = f"fade=t=in:st=0:d={fade_duration},fade=t=out:st={fade_out_start}:d={fade_duration}"
+        audio_fades = f"afade=t=in:st=0:d={fade_duration},afade=t=out:st={fade_out_start}:d={fade_duration}"
+        filters = ["-vf", video_fades, "-af", audio_fades]
+    
+    run_ffmpeg([
+        "-y", "-loglevel", "error",
+        "-ss", str(start), "-i", video_path, "-t", str(duration),
+        *filters,
+        "-c:v", "libx264", "-c:a", "aac",
+        clip_path
+    ])
+    return clip_path
+
+
 def edit_video(original_video_path, segments, output_video_path, fade_duration=0.5):
-    """Edit video by concatenating segments"""
+    """Edit video by extracting segments in parallel and concatenating them"""
     print(f"✂️  Editing video with {len(segments)} segments")
     
-    video = VideoFileClip(original_video_path)
-    clips = []
-    
-    for seg in segments:
-        start = seg['start']
-        end = seg['end']
-        clip = video.subclip(start, end).fadein(fade_duration).fadeout(fade_duration)
-        clips.append(clip)
-    
-    if clips:
-        final_clip = concatenate_videoclips(clips, method="compose")
-        final_clip.write_videofile(output_video_path, codec="libx264", audio_codec="aac")
-        print(f"✅ Edited video saved to {output_video_path}")
-    else:
+    if not segments:
         print("⚠️  No segments to include in the edited video.")
+        return
+    
+    with tempfile.TemporaryDirectory(prefix="afro-clipz-") as work_dir:
+        # Each clip is an independent ffmpeg process; threads only wait on them
+        jobs = [
+            (_to_seconds(seg['start']), _to_seconds(seg['end']), os.path.join(work_dir, f"clip_{i:04d}.mp4"))
+            for i, seg in enumerate(segments)
+        ]
+        max_workers = min(len(jobs), FFMPEG_PARALLELISM)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = [
+                pool.submit(_extract_clip, original_video_path, start, end, clip_path, fade_duration)
+                for start, end, clip_path in jobs
+            ]
+            clip_paths = [future.result() for future in futures]
+        
+        # All clips share codec settings, so the concat demuxer can stream-copy them.
+        # The list names them relative to itself, so no path needs quoting.
+        list_path = os.path.join(work_dir, "clips.txt")
+        with open(list_path, 'w') as f:
+            for clip_path in clip_paths:
+                f.write(f"file '{os.path.basename(clip_path)}'\n")
+        
+        run_ffmpeg([
+            "-y", "-loglevel", "error",
+            "-f", "concat", "-i", list_path,
+            "-c", "copy", output_video_path
+        ])
+    
+    print(f"✅ Edited video saved to {output_video_path}")
 
 
 def main():
     """Main function with zero-secrets architecture"""
     
-    print("\n" + "="*70)
-    print("🎬 AFRO-CLIPZ - AI Video Clipping")
-    print("="*70)
-    print(f"Deployment: {Config.DEPLOYMENT_TARGET} ({Config.DEPLOYMENT_MODE} mode)")
-    print(f"Whisper Model: {Config.WHISPER_MODEL}")
-    print(f"API Configured: {'Yes ✅' if Config.is_api_configured() else 'No ⚠️ (using stubs)'}")
-    print("="*70 + "\n")
+    write_block(
+        "", RULE,
+        "🎬 AFRO-CLIPZ - AI Video Clipping",
+        RULE,
+        f"Deployment: {Config.DEPLOYMENT_TARGET} ({Config.DEPLOYMENT_MODE} mode)",
+        f"Whisper Model: {Config.WHISPER_MODEL}",
+        f"API Configured: {'Yes ✅' if Config.is_api_configured() else 'No ⚠️ (using stubs)'}",
+        RULE, "",
+    )
     
     # Check maintenance mode
     if Config.MAINTENANCE_MODE_ENABLED:
@@ -308,6 +519,9 @@ def main():
     user_query = os.environ.get('USER_QUERY', "Find all clips where there is discussion around GPT-4 Turbo")
     print(f"🔍 Query: {user_query}\n")
     
+    # Pay the model load before the pipeline starts
+    warm_whisper_model(Config.WHISPER_MODEL)
+    
     # Step 1: Transcribe
     print("Step 1: Transcribing video...")
     transcription = transcribe_video(input_video, model_name=Config.WHISPER_MODEL)
@@ -318,12 +532,14 @@ def main():
     
     # Step 3: Edit Video
     print("\nStep 3: Editing video...")
-    edit_video(input_video, relevant_segments, output_video)
-    
-    print("\n" + "="*70)
-    print("✅ Processing complete!")
-    print(f"📹 Output: {output_video}")
-    print("="*70 + "\n")
+    edit_video(input_video, relevant_segments, output_video, fade_duration=Config.FADE_DURATION)
+    
+    write_block(
+        "", RULE,
+        "✅ Processing complete!",
+        f"📹 Output: {output_video}",
+        RULE, "",
+    )
 
 
 if __name__ == "__main__":
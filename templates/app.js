@@ -0,0 +1,37 @@
+// Behaviour for every page, served once as an immutable, deferred bundle.
+// Each part only wires itself up when its markup is on the page.
+
+// Nav: solid background once the 50px .nav-sentinel leaves the viewport
+const nav = document.getElementById('nav');
+const navSentinel = document.querySelector('.nav-sentinel');
+if (nav && navSentinel) {
+    new IntersectionObserver(([entry]) => {
+        nav.classList.toggle('scrolled', !entry.isIntersecting);
+    }).observe(navSentinel);
+}
+
+// Dashboard "New Project" modal
+const modal = document.getElementById('newProjectModal');
+
+// One delegated listener: in-page anchors scroll smoothly, and buttons
+// name what they do with data-action
+document.addEventListener('click', (e) => {
+    const anchor = e.target.closest('a[href^="#"]');
+    if (anchor && anchor.getAttribute('href') !== '#') {
+        const target = document.querySelector(anchor.getAttribute('href'));
+        if (target) {
+            e.preventDefault();
+            target.scrollIntoView({ behavior: 'smooth', block: 'start' });
+        }
+        return;
+    }
+
+    if (!modal) return;
+    const action = e.target === modal ? 'close-project'  // backdrop click
+        : e.target.closest('[data-action]')?.dataset.action;
+    if (action === 'new-project') {
+        modal.style.display = 'flex';
+    } else if (action === 'close-project') {
+        modal.style.display = 'none';
+    }
+});
@@ -0,0 +1,46 @@
+"""Shared test setup: the modules under test live at the repo root and in tools/
+
+web.py reads its settings at import, so the environment is set first.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT), str(ROOT / "tools")]
+
+os.environ.setdefault("LEMON_SQUEEZY_WEBHOOK_SECRET", "test-webhook-secret")
+os.environ.setdefault("HEALTH_TOKEN", "test-health-token")
+os.environ.setdefault("CORS_ORIGINS", "https://app.example.com")
+os.environ.setdefault("WHISPER_WARM_ON_STARTUP", "false")
+os.environ.setdefault("CLIP_OUTPUT_DIR", tempfile.mkdtemp(prefix="afromations-test-"))
+os.environ.pop("REDIS_URL", None)
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Async tests (pytest.mark.anyio) all run on one asyncio loop"""
+    return "asyncio"
+
+
+@pytest.fixture(scope="session")
+async def app():
+    """web.app with its lifespan entered once for the session"""
+    import web
+
+    async with web.app.router.lifespan_context(web.app):
+        yield web.app
+
+
+@pytest.fixture
+async def client(app):
+    """In-process HTTP client for web.app"""
+    import httpx
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
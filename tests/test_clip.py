@@ -0,0 +1,125 @@
+"""/api/clip: request validation, job creation and the public-only download"""
+
+import http.server
+import ipaddress
+import socket
+import threading
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+PUBLIC_ADDRESS = [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("93.184.216.34", 443))]
+
+
+@pytest.fixture
+def queued(monkeypatch):
+    """Resolve every host to a public address and record jobs instead of running them"""
+    jobs = []
+
+    async def process_clip_job(*args):
+        jobs.append(args)
+
+    monkeypatch.setattr(web.socket, "getaddrinfo", lambda *args, **kwargs: PUBLIC_ADDRESS)
+    monkeypatch.setattr(web, "process_clip_job", process_clip_job)
+    return jobs
+
+
+async def test_creates_a_queued_job(client, queued):
+    body = {"video_url": "https://videos.example.com/a.mp4", "query": "the best moment"}
+    response = await client.post("/api/clip", json=body)
+    assert response.status_code == 200
+    job_id = response.json()["job_id"]
+    assert (await web.store.get("jobs", job_id))["status"] == "queued"
+    assert queued == [(job_id, body["video_url"], body["query"], "mp4")]
+
+
+
+async def test_private_video_url_is_400(client):
+    for url in ("http://127.0.0.1/a.mp4", "http://169.254.169.254/latest/meta-data", "ftp://videos.example.com/a"):
+        response = await client.post("/api/clip", json={"video_url": url, "query": "q"})
+        assert response.status_code == 400
+
+
+@pytest.fixture
+def video_server():
+    """A local HTTP server on 127.0.0.1; routes map a path to (status, headers, body)"""
+    routes = {}
+    hits = []
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            hits.append((self.path, self.headers["host"]))
+            status, headers, body = routes[self.path]
+            self.send_response(status)
+            for name, value in {"content-length": str(len(body)), **headers}.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1], routes, hits
+    server.shutdown()
+    server.server_close()
+
+
+def resolve(monkeypatch, answers):
+    """Resolve names through `answers` (name -> list of address lists, one per lookup)"""
+    getaddrinfo = socket.getaddrinfo
+
+    def fake_getaddrinfo(host, port, *args, **kwargs):
+        if host not in answers:
+            return getaddrinfo(host, port, *args, **kwargs)
+        lookups = answers[host]
+        addresses = lookups.pop(0) if len(lookups) > 1 else lookups[0]
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (address, port)) for address in addresses]
+
+    monkeypatch.setattr(web.socket, "getaddrinfo", fake_getaddrinfo)
+
+
+def trust_loopback(monkeypatch):
+    """Treat 127.0.0.1 (but no other loopback address) as public, to reach video_server"""
+    is_public_address = web.is_public_address
+    loopback = ipaddress.ip_address("127.0.0.1")
+    monkeypatch.setattr(web, "is_public_address",
+                        lambda address: address == loopback or is_public_address(address))
+
+
+def test_download_keeps_the_requested_host(monkeypatch, video_server, tmp_path):
+    port, routes, hits = video_server
+    routes["/a.mp4"] = (200, {}, b"video bytes")
+    resolve(monkeypatch, {"videos.test": [["127.0.0.1"]]})
+    trust_loopback(monkeypatch)
+
+    web.download_video(f"http://videos.test:{port}/a.mp4", str(tmp_path / "a.mp4"), 1 << 20)
+    assert (tmp_path / "a.mp4").read_bytes() == b"video bytes"
+    assert hits == [("/a.mp4", f"videos.test:{port}")]
+
+
+def test_rebinding_host_is_refused_at_connect(monkeypatch, video_server, tmp_path):
+    port, routes, hits = video_server
+    routes["/a.mp4"] = (200, {}, b"internal")
+    # Public when checked, loopback by the time the download connects
+    resolve(monkeypatch, {"rebind.test": [["93.184.216.34"], ["127.0.0.1"]]})
+
+    with pytest.raises(web.ClipSourceError, match="public host"):
+        web.download_video(f"http://rebind.test:{port}/a.mp4", str(tmp_path / "a.mp4"), 1 << 20)
+    assert hits == []
+
+
+def test_redirect_to_private_host_is_refused(monkeypatch, video_server, tmp_path):
+    port, routes, hits = video_server
+    routes["/a.mp4"] = (302, {"location": f"http://127.0.0.2:{port}/secret"}, b"")
+    resolve(monkeypatch, {"videos.test": [["127.0.0.1"]]})
+    trust_loopback(monkeypatch)
+
+    with pytest.raises(web.ClipSourceError, match="public host"):
+        web.download_video(f"http://videos.test:{port}/a.mp4", str(tmp_path / "a.mp4"), 1 << 20)
+    assert [path for path, _ in hits] == ["/a.mp4"]
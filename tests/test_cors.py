@@ -0,0 +1,40 @@
+"""CORS: only the CORS_ORIGINS allowlist gets Access-Control-* headers"""
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+ALLOWED = "https://app.example.com"
+PREFLIGHT = {"access-control-request-method": "POST", "access-control-request-headers": "content-type"}
+
+
+def test_allowlist_comes_from_the_environment():
+    assert web.settings.CORS_ORIGINS == frozenset({ALLOWED})
+
+
+async def test_preflight_from_allowed_origin(client):
+    response = await client.options("/api/clip", headers={"origin": ALLOWED, **PREFLIGHT})
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert response.headers["access-control-max-age"] == "86400"
+
+
+async def test_other_origins_get_no_cors_headers(client):
+    origin = "https://evil.example"
+    preflight = await client.options("/api/clip", headers={"origin": origin, **PREFLIGHT})
+    assert preflight.status_code == 400
+    assert "access-control-allow-origin" not in preflight.headers
+    response = await client.get("/api/health", headers={"origin": origin})
+    assert "access-control-allow-origin" not in response.headers
+
+
+@pytest.mark.parametrize("path", ["/api/health", "/"])
+async def test_cors_headers_do_not_leak_into_later_responses(client, path):
+    response = await client.get(path, headers={"origin": ALLOWED})
+    assert response.headers["access-control-allow-origin"] == ALLOWED
+    # Prebuilt header tuples are shared: the next response must not inherit them
+    response = await client.get(path)
+    assert "access-control-allow-origin" not in response.headers
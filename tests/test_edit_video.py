@@ -0,0 +1,51 @@
+"""edit_video: clips joined by the concat demuxer keep their requested length"""
+
+import shutil
+import subprocess
+import tempfile
+
+import pytest
+
+import app_enhanced
+
+pytestmark = pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="needs ffmpeg on PATH")
+
+FPS = 25
+
+
+def make_source(path):
+    """10 s of 25 fps video and a tone, with keyframes only every 2 s"""
+    subprocess.run([
+        "ffmpeg", "-y", "-loglevel", "error",
+        "-f", "lavfi", "-i", f"testsrc=size=160x120:rate={FPS}:duration=10",
+        "-f", "lavfi", "-i", "sine=frequency=440:duration=10",
+        "-c:v", "libx264", "-g", str(2 * FPS), "-c:a", "aac", "-shortest", str(path),
+    ], check=True)
+
+
+def decoded_video(path):
+    """(frames, seconds) of the video stream, read by decoding it"""
+    progress = subprocess.run([
+        "ffmpeg", "-loglevel", "error", "-i", str(path), "-map", "0:v:0",
+        "-f", "null", "-", "-progress", "pipe:1",
+    ], check=True, capture_output=True, text=True).stdout
+    values = dict(line.split("=", 1) for line in progress.splitlines() if "=" in line)
+    return int(values["frame"]), int(values["out_time_us"]) / 1e6
+
+
+@pytest.mark.parametrize("fade_duration", [0, 0.5])
+def test_joined_clips_have_the_segment_durations(tmp_path, monkeypatch, fade_duration):
+    source = tmp_path / "source.mp4"
+    output = tmp_path / "edited.mp4"
+    # The clip list must not break on a quote in the temp dir path
+    work_root = tmp_path / "o'brien"
+    work_root.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(work_root))
+    make_source(source)
+    segments = [{"start": 1.3, "end": 3.8}, {"start": 5.1, "end": 9.9}]  # cut between keyframes
+
+    app_enhanced.edit_video(str(source), segments, str(output), fade_duration=fade_duration)
+
+    frames, seconds = decoded_video(output)
+    assert frames == pytest.approx(7.3 * FPS, abs=2)
+    assert seconds == pytest.approx(7.3, abs=0.1)
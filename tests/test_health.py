@@ -0,0 +1,45 @@
+"""/api/health: constant probe body, token-gated verbose status"""
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+AUTH = {"authorization": f"Bearer {web.settings.HEALTH_TOKEN}"}
+
+
+async def test_probe_gets_constant_body(client):
+    for params in ({}, {"verbose": "1"}):
+        response = await client.get("/api/health", params=params)
+        assert response.status_code == 200
+        assert response.content == b'{"status":"healthy"}'
+        assert response.headers["cache-control"] == "no-store"
+
+
+async def test_verbose_needs_the_token(client):
+    response = await client.get("/api/health", params={"verbose": "1"}, headers=AUTH)
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert "timestamp" in body and "config" in body
+
+
+async def test_wrong_token_gets_constant_body(client):
+    headers = {"authorization": "Bearer wrong"}
+    response = await client.get("/api/health", params={"verbose": "1"}, headers=headers)
+    assert response.content == b'{"status":"healthy"}'
+
+
+async def test_head_sends_headers_without_body(client):
+    response = await client.head("/api/health")
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["content-length"] == str(len(b'{"status":"healthy"}'))
+
+
+async def test_verbose_head_sends_headers_without_body(client):
+    get = await client.get("/api/health", params={"verbose": "1"}, headers=AUTH)
+    head = await client.head("/api/health", params={"verbose": "1"}, headers=AUTH)
+    assert head.status_code == 200
+    assert head.content == b""
+    assert head.headers["content-length"] == get.headers["content-length"]
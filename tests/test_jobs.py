@@ -0,0 +1,78 @@
+"""/api/jobs/{job_id}: id validation and coalesced store reads"""
+
+import asyncio
+import secrets
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+
+def counting_reads(monkeypatch):
+    """Make store.get_json slow enough to overlap and count its calls"""
+    calls = []
+    get_json = web.store.get_json
+
+    async def slow_get_json(namespace, key):
+        calls.append(key)
+        await asyncio.sleep(0.05)
+        return await get_json(namespace, key)
+
+    monkeypatch.setattr(web.store, "get_json", slow_get_json)
+    return calls
+
+
+async def test_malformed_job_id_is_422(client):
+    for job_id in ("short", "x" * 17, "bad.chars.here!!"):
+        assert (await client.get(f"/api/jobs/{job_id}")).status_code == 422
+
+
+async def test_url_safe_job_id_passes_validation(client):
+    response = await client.get("/api/jobs/abc-_DEF12345678")
+    assert response.status_code == 404
+
+
+async def test_concurrent_polls_share_one_store_read(client, monkeypatch):
+    job_id = secrets.token_urlsafe(12)
+    calls = counting_reads(monkeypatch)
+
+    await web.store.set("jobs", job_id, {"job_id": job_id, "status": "queued"})
+    responses = await asyncio.gather(*(client.get(f"/api/jobs/{job_id}") for _ in range(20)))
+    assert {response.status_code for response in responses} == {200}
+    assert {response.json()["status"] for response in responses} == {"queued"}
+    assert calls == [job_id]
+    assert job_id not in web._job_reads_inflight
+
+    # Within the window the cached read is reused; after it, the store is read again
+    await client.get(f"/api/jobs/{job_id}")
+    assert len(calls) == 1
+    await asyncio.sleep(web.JOB_READ_TTL_SECONDS + 0.05)
+    await client.get(f"/api/jobs/{job_id}")
+    assert len(calls) == 2
+
+
+async def test_missing_job_is_404_and_coalesced(client, monkeypatch):
+    job_id = secrets.token_urlsafe(12)
+    calls = counting_reads(monkeypatch)
+
+    responses = await asyncio.gather(*(client.get(f"/api/jobs/{job_id}") for _ in range(5)))
+    assert {response.status_code for response in responses} == {404}
+    assert responses[0].json() == {"detail": "Job not found"}
+    assert calls == [job_id]
+
+
+async def test_failed_read_is_not_cached(monkeypatch):
+    job_id = secrets.token_urlsafe(12)
+
+    async def failing_get_json(namespace, key):
+        raise ConnectionError("store unavailable")
+
+    monkeypatch.setattr(web.store, "get_json", failing_get_json)
+    with pytest.raises(ConnectionError):
+        await web.read_job(job_id)
+    assert job_id not in web._job_reads
+    monkeypatch.undo()
+    await web.store.set("jobs", job_id, {"status": "queued"})
+    assert await web.read_job(job_id) == b'{"status":"queued"}'
@@ -0,0 +1,32 @@
+"""web.app lifespan: background tasks and the opt-in Whisper warm-up"""
+
+import asyncio
+import threading
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_lifespan_runs_the_background_tasks(app):
+    assert app.router.on_startup == [] and app.router.on_shutdown == []
+    assert not app.state.webhook_worker.done()
+    assert not app.state.clip_sweeper.done()
+
+
+async def test_warm_up_is_off_unless_enabled(monkeypatch):
+    warmed = threading.Event()
+    monkeypatch.setattr(web, "warm_clip_pipeline", warmed.set)
+
+    monkeypatch.setattr(web.settings, "WHISPER_WARM_ON_STARTUP", False)
+    await web.start_whisper_warmup()
+    # The clip pool runs one job at a time, so this waits out anything queued
+    await asyncio.get_running_loop().run_in_executor(web.clip_executor, lambda: None)
+    assert not warmed.is_set()
+
+    monkeypatch.setattr(web.settings, "WHISPER_WARM_ON_STARTUP", True)
+    await web.start_whisper_warmup()
+    assert await asyncio.to_thread(warmed.wait, 5)
+
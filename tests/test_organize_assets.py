@@ -0,0 +1,91 @@
+"""Header-only image dimension parsing in tools/organize_assets.py"""
+
+import io
+import struct
+
+import pytest
+
+import organize_assets
+
+Image = pytest.importorskip("PIL.Image")
+
+
+def encode(size, image_format, mode="RGB", **save_options):
+    buffer = io.BytesIO()
+    Image.new(mode, size).save(buffer, image_format, **save_options)
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("image_format, mode, save_options, chunk", [
+    ("WEBP", "RGB", {}, b"VP8 "),
+    ("WEBP", "RGB", {"lossless": True}, b"VP8L"),
+    ("WEBP", "RGBA", {}, b"VP8X"),
+])
+def test_webp_variants(image_format, mode, save_options, chunk):
+    data = encode((321, 123), image_format, mode, **save_options)
+    assert data[12:16] == chunk
+    assert organize_assets.parse_image_dimensions(data) == {"width": 321, "height": 123}
+
+
+@pytest.mark.parametrize("image_format", ["JPEG", "PNG", "GIF"])
+def test_other_formats(image_format):
+    data = encode((640, 17), image_format)
+    assert organize_assets.parse_image_dimensions(data) == {"width": 640, "height": 17}
+
+
+def test_progressive_jpeg():
+    data = encode((200, 100), "JPEG", progressive=True)
+    assert organize_assets.parse_image_dimensions(data) == {"width": 200, "height": 100}
+
+
+def segment(marker, payload):
+    return b"\xff" + bytes([marker]) + struct.pack(">H", len(payload) + 2) + payload
+
+
+def test_jpeg_skips_segments_and_fill_bytes_before_sof():
+    sof = segment(0xC0, struct.pack(">BHHB", 8, 480, 720, 3) + b"\x00" * 9)
+    header = (
+        b"\xff\xd8"
+        + segment(0xE0, b"JFIF\x00" + b"\x00" * 9)
+        + segment(0xE1, b"Exif\x00\x00" + b"\x00" * 2000)
+        + segment(0xC4, b"\x00" * 30)  # DHT shares the SOF range but is not one
+        + b"\xff\xff"  # fill bytes before a marker
+        + sof
+    )
+    assert organize_assets.parse_image_dimensions(header) == {"width": 720, "height": 480}
+
+
+def test_jpeg_sof_beyond_probed_header_is_none():
+    header = b"\xff\xd8" + segment(0xE1, b"\x00" * 100)
+    assert organize_assets.parse_image_dimensions(header) is None
+
+
+def test_corrupt_jpeg_is_none():
+    assert organize_assets.parse_image_dimensions(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00garbage-garbage") is None
+
+
+@pytest.mark.parametrize("header", [
+    b"",
+    b"not an image at all",
+    b"RIFF\x00\x00\x00\x00WEBPVP8 ",  # truncated WebP
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x01",  # IHDR cut short
+    b"GIF89a\x40\x00\x30",  # screen descriptor cut short
+    b"\xff\xd8\xff\xc0\x00\x11\x08\x00",  # SOF cut short
+    b"RIFF\x00\x00\x00\x00WAVEfmt " + b"\x00" * 32,
+])
+def test_unrecognized_or_truncated_is_none(header):
+    assert organize_assets.parse_image_dimensions(header) is None
+
+
+def test_probe_asset_of_truncated_image_has_no_dimensions(tmp_path):
+    path = tmp_path / "cut.png"
+    path.write_bytes(encode((64, 48), "PNG")[:20])
+    assert organize_assets.probe_asset(path)[1] is None
+
+
+def test_probe_asset_reads_dimensions_during_hash(tmp_path):
+    path = tmp_path / "frame.webp"
+    path.write_bytes(encode((64, 48), "WEBP"))
+    digest, dimensions = organize_assets.probe_asset(path)
+    assert len(digest) == 64
+    assert dimensions == {"width": 64, "height": 48}
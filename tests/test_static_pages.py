@@ -0,0 +1,75 @@
+"""StaticPage: precompressed variants, conditional requests and HEAD"""
+
+from email.utils import formatdate
+
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+IDENTITY = {"accept-encoding": "identity"}
+
+
+@pytest.mark.parametrize("encoding", ["identity", "gzip"])
+async def test_head_sends_headers_without_body(client, encoding):
+    headers = {"accept-encoding": encoding}
+    get = await client.get(web.BASE_CSS_URL, headers=headers)
+    head = await client.head(web.BASE_CSS_URL, headers=headers)
+    assert head.status_code == 200
+    assert head.content == b""
+    for name in ("content-length", "content-encoding", "etag", "cache-control", "last-modified"):
+        assert head.headers.get(name) == get.headers.get(name)
+
+
+async def test_matching_etag_is_304_with_last_modified(client):
+    first = await client.get("/", headers=IDENTITY)
+    etag = first.headers["etag"]
+    for if_none_match in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = await client.get("/", headers={**IDENTITY, "if-none-match": if_none_match})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        assert response.headers["last-modified"] == first.headers["last-modified"]
+
+    stale = await client.get("/", headers={**IDENTITY, "if-none-match": '"other"'})
+    assert stale.status_code == 200
+
+
+async def test_last_modified_is_the_newest_source_mtime(client):
+    response = await client.get("/", headers=IDENTITY)
+    assert response.headers["last-modified"] == formatdate(web.HERO_PAGE.last_modified, usegmt=True)
+
+
+async def test_if_modified_since_is_304_unless_older(client):
+    page = web.HERO_PAGE
+    current = formatdate(page.last_modified, usegmt=True)
+    older = formatdate(page.last_modified - 60, usegmt=True)
+    assert (await client.get("/", headers={"if-modified-since": current})).status_code == 304
+    assert (await client.get("/", headers={"if-modified-since": older})).status_code == 200
+    assert (await client.get("/", headers={"if-modified-since": "garbage"})).status_code == 200
+
+
+async def test_if_none_match_takes_precedence_over_date(client):
+    headers = {
+        **IDENTITY,
+        "if-none-match": '"other"',
+        "if-modified-since": formatdate(web.HERO_PAGE.last_modified, usegmt=True),
+    }
+    assert (await client.get("/", headers=headers)).status_code == 200
+
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("", "identity"),
+    ("gzip, br", "br"),
+    ("gzip", "gzip"),
+    ("*", "br"),
+    ("br;q=0, *", "gzip"),
+    ("br;q=0, gzip;q=0, *", "identity"),
+    ("gzip;q=0.0, *;q=0.5", "br"),
+    ("*;q=0", "identity"),
+    ("br;q=0, gzip;q=nonsense", "identity"),
+])
+def test_select_honours_explicit_q_zero_over_wildcard(accept_encoding, expected):
+    page = web.HERO_PAGE
+    assert page.select(accept_encoding) is page.variants[expected]
@@ -0,0 +1,126 @@
+"""Lemon Squeezy webhook: signature check, body cap, validation and dedup"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+
+import orjson
+import pytest
+
+import web
+
+pytestmark = pytest.mark.anyio
+
+SECRET = web.settings.LEMON_SQUEEZY_WEBHOOK_SECRET.encode()
+URL = "/api/webhooks/lemonsqueezy"
+
+
+def make_event():
+    subscription_id = secrets.token_hex(4)
+    body = orjson.dumps({
+        "meta": {"event_name": "subscription_created", "event_id": secrets.token_hex(8)},
+        "data": {"id": subscription_id, "attributes": {"status": "active", "user_email": "a@example.com"}},
+    })
+    return body, subscription_id
+
+
+def sign(body):
+    return hmac.new(SECRET, body, hashlib.sha256).hexdigest()
+
+
+async def deliver(client, body, signature=None):
+    """POST a delivery and wait until the worker has handled it"""
+    headers = {"x-signature": sign(body) if signature is None else signature}
+    response = await client.post(URL, content=body, headers=headers)
+    await web.webhook_queue.join()
+    return response
+
+
+async def test_rejects_missing_and_wrong_signatures(client):
+    body, subscription_id = make_event()
+    for signature in ("", "not-hex", sign(body + b" ")):
+        response = await deliver(client, body, signature)
+        assert response.status_code == 401
+        assert response.json() == {"detail": "Invalid signature"}
+    assert await web.store.get("subscriptions", subscription_id) is None
+
+
+async def test_applies_signed_event(client):
+    body, subscription_id = make_event()
+    response = await deliver(client, body)
+    assert response.json() == {"received": True}
+    assert (await web.store.get("subscriptions", subscription_id))["status"] == "active"
+
+
+async def test_accepts_sha256_prefixed_signature(client):
+    body, subscription_id = make_event()
+    assert (await deliver(client, body, "sha256=" + sign(body))).json() == {"received": True}
+    assert await web.store.get("subscriptions", subscription_id) is not None
+
+
+async def test_signed_malformed_payload_is_400(client):
+    for body in (b"not json", b'{"meta": "oops"}'):
+        assert (await deliver(client, body)).status_code == 400
+
+
+async def test_body_over_limit_is_413(client):
+    body = b"x" * (web.WEBHOOK_MAX_BODY_BYTES + 1)
+    assert (await deliver(client, body)).status_code == 413
+
+
+async def test_redelivery_of_an_event_is_a_duplicate(client):
+    body, _ = make_event()
+    assert (await deliver(client, body)).json() == {"received": True}
+    assert (await deliver(client, body)).json() == {"received": True, "duplicate": True}
+
+
+def flaky_apply(monkeypatch, failures):
+    """Make the next `failures` applies raise; returns the list of applied events"""
+    record_subscription = web.record_subscription
+    applied = []
+
+    async def flaky(event_name, data):
+        applied.append(data["id"])
+        if len(applied) <= failures:
+            raise RuntimeError("store down")
+        await record_subscription(event_name, data)
+
+    monkeypatch.setattr(web, "record_subscription", flaky)
+    monkeypatch.setattr(web, "WEBHOOK_RETRY_DELAY_SECONDS", 0)
+    return applied
+
+
+async def test_failed_apply_is_retried(client, monkeypatch):
+    body, subscription_id = make_event()
+    applied = flaky_apply(monkeypatch, failures=1)
+    assert (await deliver(client, body)).json() == {"received": True}
+    assert applied == [subscription_id, subscription_id]
+    assert await web.store.get("subscriptions", subscription_id) is not None
+
+
+async def test_event_that_failed_every_attempt_is_not_a_duplicate(client, monkeypatch):
+    body, subscription_id = make_event()
+    flaky_apply(monkeypatch, failures=web.WEBHOOK_APPLY_ATTEMPTS)
+    assert (await deliver(client, body)).json() == {"received": True}
+    assert await web.store.get("subscriptions", subscription_id) is None
+    # A resend from the dashboard is applied rather than dropped
+    assert (await deliver(client, body)).json() == {"received": True}
+    assert await web.store.get("subscriptions", subscription_id) is not None
+
+
+async def test_concurrent_deliveries_are_queued_once(client, monkeypatch):
+    body, subscription_id = make_event()
+    applied = flaky_apply(monkeypatch, failures=0)
+    get = web.store.get
+
+    async def slow_get(namespace, key):
+        await asyncio.sleep(0.05)
+        return await get(namespace, key)
+
+    monkeypatch.setattr(web.store, "get", slow_get)
+    headers = {"x-signature": sign(body)}
+    responses = await asyncio.gather(*(client.post(URL, content=body, headers=headers) for _ in range(3)))
+    await web.webhook_queue.join()
+    assert sorted(response.json().get("duplicate", False) for response in responses) == [False, True, True]
+    assert applied == [subscription_id]
@@ -0,0 +1,69 @@
+"""Whisper model cache, warm-up and batched fallback in app_enhanced.py"""
+
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+import app_enhanced
+
+
+class FakeWhisperModel:
+    loads = 0
+
+    def __init__(self, model_name, **options):
+        FakeWhisperModel.loads += 1
+        self.model_name = model_name
+        self.transcribed = []
+
+    def transcribe(self, audio, **options):
+        self.transcribed.append((audio, options))
+        return iter([SimpleNamespace(start=0.0, end=1.0, text=" sequential ")]), None
+
+
+@pytest.fixture
+def fake_model(monkeypatch):
+    monkeypatch.setattr(app_enhanced, "WhisperModel", FakeWhisperModel)
+    FakeWhisperModel.loads = 0
+    app_enhanced.load_whisper_model.cache_clear()
+    yield FakeWhisperModel
+    app_enhanced.load_whisper_model.cache_clear()
+
+
+def test_model_is_loaded_once_per_name(fake_model):
+    first = app_enhanced.load_whisper_model("base")
+    assert app_enhanced.load_whisper_model("base") is first
+    assert app_enhanced.load_whisper_model("tiny") is not first
+    assert fake_model.loads == 2
+
+
+def test_warm_up_runs_one_second_of_silence_through_the_cached_model(fake_model):
+    model = app_enhanced.warm_whisper_model("base")
+    assert model is app_enhanced.load_whisper_model("base")
+    assert fake_model.loads == 1
+    (audio, options), = model.transcribed
+    assert audio.dtype == np.float32 and audio.shape == (16000,) and not audio.any()
+    assert options["vad_filter"] is False
+
+
+class FailingBatchedPipeline:
+    """Like faster-whisper's pipeline: transcribe() is lazy, decoding fails on iteration"""
+
+    def __init__(self, model):
+        self.model = model
+
+    def transcribe(self, audio, **options):
+        def segments():
+            raise RuntimeError("batched decode failed")
+            yield
+        return segments(), None
+
+
+def test_batched_decode_error_falls_back_to_sequential(fake_model, monkeypatch):
+    monkeypatch.setattr(app_enhanced, "BatchedInferencePipeline", FailingBatchedPipeline)
+    monkeypatch.setattr(app_enhanced, "extract_audio", lambda path: np.zeros(16000, dtype=np.float32))
+    monkeypatch.setattr(app_enhanced.Config, "WHISPER_BATCH_SIZE", 16)
+
+    transcript = app_enhanced.transcribe_video("clip.mp4", model_name="base")
+    assert transcript == [{"start": 0.0, "end": 1.0, "text": "sequential"}]
+    assert len(app_enhanced.load_whisper_model("base").transcribed) == 1
@@ -20,12 +20,16 @@ import argparse
 import hashlib
 import json
 import mimetypes
+import mmap
 import os
+import re
 import shutil
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 # Asset category mappings
 CATEGORY_MAPPINGS = {
@@ -64,6 +68,11 @@ CATEGORY_MAPPINGS = {
     ".fig": "design",
 }
 
+# Raster formats PIL can size; everything else skips the dimension lookup
+IMAGE_EXTENSIONS = frozenset({
+    ".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".bmp", ".tif", ".tiff",
+})
+
 # Special filename mappings (override category based on name)
 SPECIAL_FILES = {
     "afromations_flag_pick.gif": "hero",
@@ -71,14 +80,118 @@ SPECIAL_FILES = {
     "favicon": "brand",
 }
 
+# One C-level scan rejects the common case (no special pattern in the name)
+SPECIAL_FILES_RE = re.compile("|".join(map(re.escape, SPECIAL_FILES)))
 
-def compute_hash(file_path: Path) -> str:
-    """Compute SHA-256 hash of file contents."""
-    sha256_hash = hashlib.sha256()
+
+# Read size for files that cannot be memory-mapped
+HASH_CHUNK_SIZE = 1024 * 1024
+
+# Leading bytes inspected for image dimensions (covers JPEG EXIF segments)
+HEADER_PROBE_SIZE = 64 * 1024
+
+# JPEG start-of-frame markers that carry the image size
+JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _parse_jpeg_dimensions(header: bytes) -> Optional[Dict[str, int]]:
+    """Walk JPEG segments up to the first start-of-frame marker."""
+    offset = 2
+    while offset + 9 <= len(header):
+        if header[offset] != 0xFF:
+            return None
+        marker = header[offset + 1]
+        if marker == 0xFF:
+            offset += 1
+            continue
+        if marker in JPEG_SOF_MARKERS:
+            height, width = struct.unpack_from(">HH", header, offset + 5)
+            return {"width": width, "height": height}
+        if marker == 0x01 or 0xD0 <= marker <= 0xD9:
+            offset += 2
+            continue
+        (segment_length,) = struct.unpack_from(">H", header, offset + 2)
+        offset += 2 + segment_length
+    return None
+
+
+def parse_image_dimensions(header: bytes) -> Optional[Dict[str, int]]:
+    """Read dimensions from PNG, GIF, JPEG or WebP header bytes without PIL."""
+    # Each branch checks the length it unpacks: a truncated file is just unknown
+    if header[:8] == b"\x89PNG\r\n\x1a\n" and header[12:16] == b"IHDR" and len(header) >= 24:
+        width, height = struct.unpack_from(">II", header, 16)
+        return {"width": width, "height": height}
+
+    if header[:6] in (b"GIF87a", b"GIF89a") and len(header) >= 10:
+        width, height = struct.unpack_from("<HH", header, 6)
+        return {"width": width, "height": height}
+
+    if header[:3] == b"\xff\xd8\xff":
+        return _parse_jpeg_dimensions(header)
+
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP" and len(header) >= 30:
+        chunk = header[12:16]
+        if chunk == b"VP8 " and header[23:26] == b"\x9d\x01\x2a":
+            width, height = struct.unpack_from("<HH", header, 26)
+            return {"width": width & 0x3FFF, "height": height & 0x3FFF}
+        if chunk == b"VP8L" and header[20] == 0x2F:
+            (bits,) = struct.unpack_from("<I", header, 21)
+            return {"width": (bits & 0x3FFF) + 1, "height": ((bits >> 14) & 0x3FFF) + 1}
+        if chunk == b"VP8X":
+            width = int.from_bytes(header[24:27], "little") + 1
+            height = int.from_bytes(header[27:30], "little") + 1
+            return {"width": width, "height": height}
+
+    return None
+
+
+def _hash_with_header(file_path: Path) -> Tuple[str, bytes]:
+    """Hash file contents, returning the digest and the leading header bytes."""
     with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
+        try:
+            # A single update over the mapped file lets OpenSSL run its
+            # SHA-NI path across the whole buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.sha256(mm).hexdigest(), mm[:HEADER_PROBE_SIZE]
+        except (ValueError, OSError):
+            # Empty files and special files cannot be mapped
+            pass
+
+        sha256_hash = hashlib.sha256()
+        header = b""
+        for byte_block in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            if not header:
+                header = byte_block[:HEADER_PROBE_SIZE]
             sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+        return sha256_hash.hexdigest(), header
+
+
+def compute_hash(file_path: Path) -> str:
+    """Compute SHA-256 hash of file contents."""
+    return _hash_with_header(file_path)[0]
+
+
+def probe_asset(file_path: Path) -> Tuple[str, Optional[Dict[str, int]]]:
+    """Hash a file and read its image dimensions in the same pass."""
+    content_hash, header = _hash_with_header(file_path)
+    return content_hash, parse_image_dimensions(header)
+
+
+def probe_files(
+    files: List[Path], max_workers: int
+) -> Dict[Path, Tuple[str, Optional[Dict[str, int]]]]:
+    """Probe many files (see probe_asset), in parallel across processes."""
+    if max_workers <= 1 or len(files) <= 1:
+        return {file_path: probe_asset(file_path) for file_path in files}
+
+    chunksize = max(1, len(files) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return dict(zip(files, pool.map(probe_asset, files, chunksize=chunksize)))
+
+
+def is_system_file(file_path: Path) -> bool:
+    """Check whether a file is a placeholder that should never be organized."""
+    return file_path.name.startswith(".") or file_path.name in ["README.md", ".gitkeep"]
 
 
 def get_image_dimensions(file_path: Path) -> Optional[Dict[str, int]]:
@@ -98,10 +211,12 @@ def get_category(file_path: Path) -> str:
     filename = file_path.name.lower()
     extension = file_path.suffix.lower()
 
-    # Check special filename mappings first
-    for pattern, category in SPECIAL_FILES.items():
-        if pattern in filename:
-            return category
+    # Check special filename mappings first (in table order, so priority
+    # is unchanged when a name contains more than one pattern)
+    if SPECIAL_FILES_RE.search(filename):
+        for pattern, category in SPECIAL_FILES.items():
+            if pattern in filename:
+                return category
 
     # Fall back to extension mapping
     return CATEGORY_MAPPINGS.get(extension, "misc")
@@ -125,6 +240,15 @@ def load_manifest(manifest_path: Path) -> Dict[str, Any]:
     }
 
 
+def build_hash_index(manifest: Dict[str, Any]) -> Dict[str, str]:
+    """Map each content hash in the manifest to the asset path holding it."""
+    return {
+        asset_info["content_hash"]: asset_path
+        for asset_path, asset_info in manifest.get("assets", {}).items()
+        if "content_hash" in asset_info
+    }
+
+
 def save_manifest(manifest_path: Path, manifest: Dict[str, Any]) -> None:
     """Save manifest to disk."""
     manifest["generated_at"] = datetime.utcnow().isoformat() + "Z"
@@ -137,25 +261,36 @@ def organize_asset(
     file_path: Path,
     output_dir: Path,
     manifest: Dict[str, Any],
-    dry_run: bool = False
+    dry_run: bool = False,
+    content_hash: Optional[str] = None,
+    hash_index: Optional[Dict[str, str]] = None,
+    dimensions: Optional[Dict[str, int]] = None
 ) -> Optional[str]:
     """
     Organize a single asset file.
 
+    If content_hash is given (with dimensions, from probe_asset) it is
+    trusted instead of re-reading the file.
+    hash_index (from build_hash_index) is consulted for duplicates and kept
+    up to date; pass the same dict across calls to avoid rebuilding it.
     Returns the relative path in assets directory, or None if skipped.
     """
-    if file_path.name.startswith(".") or file_path.name in ["README.md", ".gitkeep"]:
+    if is_system_file(file_path):
         print(f"  Skipping: {file_path.name} (system file)")
         return None
 
-    # Compute content hash
-    content_hash = compute_hash(file_path)
+    # Compute content hash and header-derived dimensions in one read
+    if content_hash is None:
+        content_hash, dimensions = probe_asset(file_path)
 
     # Check for duplicates
-    for asset_path, asset_info in manifest.get("assets", {}).items():
-        if asset_info.get("content_hash") == f"sha256:{content_hash}":
-            print(f"  Skipping: {file_path.name} (duplicate of {asset_path})")
-            return None
+    if hash_index is None:
+        hash_index = build_hash_index(manifest)
+    hash_key = f"sha256:{content_hash}"
+    duplicate_of = hash_index.get(hash_key)
+    if duplicate_of is not None:
+        print(f"  Skipping: {file_path.name} (duplicate of {duplicate_of})")
+        return None
 
     # Determine category and destination
     category = get_category(file_path)
@@ -185,20 +320,23 @@ def organize_asset(
     # Build asset metadata
     asset_info = {
         "original_name": file_path.name,
-        "content_hash": f"sha256:{content_hash}",
+        "content_hash": hash_key,
         "size_bytes": dest_path.stat().st_size,
         "mime_type": get_mime_type(dest_path),
         "category": category,
         "uploaded_at": datetime.utcnow().isoformat() + "Z",
     }
 
-    # Add dimensions for images
-    dimensions = get_image_dimensions(dest_path)
+    # Add dimensions for images, asking PIL only about raster files the
+    # header probe does not understand
+    if dimensions is None and file_path.suffix.lower() in IMAGE_EXTENSIONS:
+        dimensions = get_image_dimensions(dest_path)
     if dimensions:
         asset_info["dimensions"] = dimensions
 
     # Update manifest
     manifest["assets"][relative_path] = asset_info
+    hash_index[hash_key] = relative_path
 
     return relative_path
 
@@ -230,6 +368,12 @@ def main():
         action="store_true",
         help="Show what would be done without making changes"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Number of processes used to hash files (default: CPU count)"
+    )
     parser.add_argument(
         "--verbose", "-v",
         action="store_true",
@@ -265,12 +409,23 @@ def main():
         print("DRY RUN - no changes will be made")
     print()
 
+    # Hash and probe everything up front in parallel; moves and manifest
+    # updates stay sequential so name collisions and in-batch duplicates
+    # resolve in order
+    files = sorted(files)
+    probes = probe_files([f for f in files if not is_system_file(f)], args.jobs)
+    hash_index = build_hash_index(manifest)
+
     # Process each file
     organized = 0
     skipped = 0
 
-    for file_path in sorted(files):
-        result = organize_asset(file_path, args.output, manifest, args.dry_run)
+    for file_path in files:
+        content_hash, dimensions = probes.get(file_path, (None, None))
+        result = organize_asset(
+            file_path, args.output, manifest, args.dry_run,
+            content_hash=content_hash, hash_index=hash_index, dimensions=dimensions
+        )
         if result:
             organized += 1
         else:
@@ -11,19 +11,53 @@ Design Philosophy:
 """
 
 import os
-import json
+import re
+import asyncio
 import hashlib
+import hmac
+import ipaddress
+import math
+import gzip
 import secrets
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+import socket
+import tempfile
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence
 from pathlib import Path
+from urllib.parse import parse_qsl, urljoin, urlsplit
+from email.utils import formatdate, parsedate_to_datetime
 
-from fastapi import FastAPI, Request, HTTPException, Depends, BackgroundTasks, Form, UploadFile, File
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse
+from fastapi import FastAPI, Request, HTTPException, BackgroundTasks
+from fastapi import Path as PathParam
+from fastapi.responses import ORJSONResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, EmailStr
+from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import BaseModel, ConfigDict, EmailStr
+from cachetools import TLRUCache, TTLCache
+import orjson
+import requests
 import uvicorn
+from requests.adapters import HTTPAdapter
+from urllib3.util import connection as urllib3_connection
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+try:
+    import brotli
+except ImportError:
+    brotli = None  # Optional; pages are still served gzip-compressed
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None  # Optional dependency for shared multi-worker state
 
 
 class Settings:
@@ -37,14 +71,35 @@ class Settings:
     LEMON_SQUEEZY_API_KEY: str = os.environ.get('LEMON_SQUEEZY_API_KEY', '')
     LEMON_SQUEEZY_STORE_ID: str = os.environ.get('LEMON_SQUEEZY_STORE_ID', '')
     LEMON_SQUEEZY_WEBHOOK_SECRET: str = os.environ.get('LEMON_SQUEEZY_WEBHOOK_SECRET', '')
+    # Encoded once; None means webhook signing is not configured
+    LEMON_SQUEEZY_WEBHOOK_SECRET_BYTES: Optional[bytes] = (
+        LEMON_SQUEEZY_WEBHOOK_SECRET.encode() if LEMON_SQUEEZY_WEBHOOK_SECRET else None
+    )
     SUPABASE_URL: str = os.environ.get('SUPABASE_URL', '')
     SUPABASE_ANON_KEY: str = os.environ.get('SUPABASE_ANON_KEY', '')
     SENTRY_DSN: str = os.environ.get('SENTRY_DSN', '')
     GROQ_API_KEY: str = os.environ.get('GROQ_API_KEY', '')
     WHISPER_MODEL: str = os.environ.get('WHISPER_MODEL', 'base')
+    # Load Whisper at startup so the first clip job does not pay for it; opt-in,
+    # since every web worker then holds its own copy of the model in memory
+    WHISPER_WARM_ON_STARTUP: bool = os.environ.get('WHISPER_WARM_ON_STARTUP', 'false').lower() == 'true'
     INVITE_ONLY: bool = os.environ.get('INVITE_ONLY', 'true').lower() == 'true'
+    CLIP_OUTPUT_DIR: str = os.environ.get('CLIP_OUTPUT_DIR', 'outputs')
+    CLIP_MAX_CONCURRENT_JOBS: int = int(os.environ.get('CLIP_MAX_CONCURRENT_JOBS', 1))
+    CLIP_MAX_DOWNLOAD_BYTES: int = int(os.environ.get('CLIP_MAX_DOWNLOAD_BYTES', 2 << 30))
+    REDIS_URL: str = os.environ.get('REDIS_URL', '')
+    HEALTH_TOKEN: str = os.environ.get('HEALTH_TOKEN', '')
+    JOB_TTL_SECONDS: int = int(os.environ.get('JOB_TTL_SECONDS', 86400))
+    # Exact origins allowed to call the API from another site (comma-separated)
+    CORS_ORIGINS: frozenset = frozenset(
+        origin.strip() for origin in os.environ.get('CORS_ORIGINS', '').split(',') if origin.strip()
+    )
+    # Workers for `python web.py`; 0 = one per CPU, only honoured with REDIS_URL
+    # (not WEB_CONCURRENCY, which the uvicorn CLI reads with other semantics)
+    WEB_WORKERS: int = int(os.environ.get('WEB_WORKERS', 0))
 
     @classmethod
+    @lru_cache(maxsize=None)
     def is_configured(cls, *keys: str) -> bool:
         for key in keys:
             value = getattr(cls, key, '')
@@ -54,43 +109,154 @@ class Settings:
 
 settings = Settings()
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the webhook worker and clip sweeper, and queue the Whisper warm-up"""
+    await start_webhook_worker()
+    await start_clip_sweeper()
+    await start_whisper_warmup()
+    try:
+        yield
+    finally:
+        await stop_webhook_worker()
+        await stop_clip_sweeper()
+
 app = FastAPI(
+    lifespan=lifespan,
     title="AfroMations",
     description="AI Documentary & Clipping Studio for Seattle/Washington Creators",
     version="1.0.0",
     docs_url="/api/docs" if settings.DEBUG else None,
     redoc_url="/api/redoc" if settings.DEBUG else None,
+    default_response_class=ORJSONResponse,
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+# The pages call the API same-origin and webhooks are server-to-server, so
+# CORS is only needed (and only installed) for explicitly listed origins
+if settings.CORS_ORIGINS:
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=settings.CORS_ORIGINS,
+        allow_credentials=True,
+        allow_methods=["GET", "POST"],
+        allow_headers=["Authorization", "Content-Type"],
+        max_age=86400,
+    )
+
+
+
+# =============================================================================
+# STATE STORE
+# =============================================================================
+
+def _entry_expiry(key: str, entry: tuple, now: float) -> float:
+    ttl = entry[0]
+    return now + ttl if ttl else math.inf
+
+class MemoryStore:
+    """Process-local state; only coherent with a single uvicorn worker
+
+    Each namespace is an LRU of at most MAX_ENTRIES (ttl, value) entries that
+    also expire after their ttl, so a long-running worker stays bounded.
+    """
+
+    MAX_ENTRIES = 50_000
+
+    def __init__(self) -> None:
+        self._data: Dict[str, TLRUCache] = {}
+
+    def _namespace(self, namespace: str) -> TLRUCache:
+        cache = self._data.get(namespace)
+        if cache is None:
+            cache = self._data[namespace] = TLRUCache(
+                maxsize=self.MAX_ENTRIES, ttu=_entry_expiry, timer=time.monotonic
+            )
+        return cache
+
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._namespace(namespace).get(key)
+        return entry[1] if entry is not None else None
+
+    async def set(self, namespace: str, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        self._namespace(namespace)[key] = (ttl, value)
+
+    async def update(self, namespace: str, key: str, ttl: Optional[int] = None, **fields: Any) -> None:
+        value = await self.get(namespace, key) or {}
+        value.update(fields)
+        await self.set(namespace, key, value, ttl=ttl)
+
+    async def get_json(self, namespace: str, key: str) -> Optional[bytes]:
+        """The value as JSON bytes, ready to send"""
+        value = await self.get(namespace, key)
+        return orjson.dumps(value) if value is not None else None
+
+    async def delete(self, namespace: str, key: str) -> None:
+        self._namespace(namespace).pop(key, None)
+
+class RedisStore:
+    """Redis-backed state shared by every worker and kept across redeploys"""
+
+    def __init__(self, url: str) -> None:
+        self._redis = aioredis.Redis.from_url(url)
+
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._redis.get(f"{namespace}:{key}")
+        return orjson.loads(raw) if raw is not None else None
+
+    async def set(self, namespace: str, key: str, value: Dict[str, Any], ttl: Optional[int] = None) -> None:
+        await self._redis.set(f"{namespace}:{key}", orjson.dumps(value), ex=ttl)
+
+    async def update(self, namespace: str, key: str, ttl: Optional[int] = None, **fields: Any) -> None:
+        value = await self.get(namespace, key) or {}
+        value.update(fields)
+        await self.set(namespace, key, value, ttl=ttl)
+
+    async def get_json(self, namespace: str, key: str) -> Optional[bytes]:
+        """The value as JSON bytes, ready to send (already stored that way)"""
+        return await self._redis.get(f"{namespace}:{key}")
+
+    async def delete(self, namespace: str, key: str) -> None:
+        await self._redis.delete(f"{namespace}:{key}")
+
+def create_store():
+    if settings.REDIS_URL and aioredis is not None:
+        return RedisStore(settings.REDIS_URL)
+    return MemoryStore()
+
+# Namespaces: "sessions", "invites", "users", "jobs", "subscriptions", "webhook_events"
+store = create_store()
+
+def utc_now_iso() -> str:
+    """Timezone-aware UTC timestamp for stored records (datetime.utcnow is deprecated)"""
+    return datetime.now(timezone.utc).isoformat()
+
+# Whisper and ffmpeg are CPU-bound; run them off the event loop in a bounded pool
+clip_executor = ThreadPoolExecutor(
+    max_workers=max(1, settings.CLIP_MAX_CONCURRENT_JOBS), thread_name_prefix="clip"
 )
 
-sessions: Dict[str, Dict[str, Any]] = {}
-invites: Dict[str, Dict[str, Any]] = {}
-users: Dict[str, Dict[str, Any]] = {}
 
+class RequestModel(BaseModel):
+    """Shared config for request bodies: read-only once validated, unknown
+    fields dropped, surrounding whitespace stripped from strings"""
+    model_config = ConfigDict(extra="ignore", frozen=True, str_strip_whitespace=True)
 
-class InviteRequest(BaseModel):
+class InviteRequest(RequestModel):
     email: EmailStr
     name: str
     company: Optional[str] = None
     use_case: Optional[str] = None
 
-class LoginRequest(BaseModel):
+class LoginRequest(RequestModel):
     email: EmailStr
     invite_code: Optional[str] = None
 
-class ClipRequest(BaseModel):
+class ClipRequest(RequestModel):
     video_url: Optional[str] = None
     query: str
     output_format: str = "mp4"
 
-class WebhookPayload(BaseModel):
+class WebhookPayload(RequestModel):
     meta: Dict[str, Any]
     data: Dict[str, Any]
 
@@ -134,1473 +300,835 @@ DESIGN_SYSTEM = {
 
 
 # =============================================================================
-# CSS STYLES - Motion Primitives Inspired
+# PAGE TEMPLATES - Motion Primitives inspired, shared chrome in base.html
 # =============================================================================
 
-def get_base_styles() -> str:
-    """Generate base CSS with design system tokens"""
-    return f'''
-    :root {{
-        --color-primary: {DESIGN_SYSTEM["colors"]["primary"]};
-        --color-accent: {DESIGN_SYSTEM["colors"]["accent"]};
-        --color-accent-light: {DESIGN_SYSTEM["colors"]["accent_light"]};
-        --color-background: {DESIGN_SYSTEM["colors"]["background"]};
-        --color-surface: {DESIGN_SYSTEM["colors"]["surface"]};
-        --color-muted: {DESIGN_SYSTEM["colors"]["muted"]};
-        --color-border: {DESIGN_SYSTEM["colors"]["border"]};
-        --font-family: {DESIGN_SYSTEM["typography"]["font_family"]};
-        --transition-fast: {DESIGN_SYSTEM["animation"]["fast"]};
-        --transition-normal: {DESIGN_SYSTEM["animation"]["normal"]};
-        --transition-slow: {DESIGN_SYSTEM["animation"]["slow"]};
-        --easing: {DESIGN_SYSTEM["animation"]["easing"]};
-    }}
-
-    * {{
-        margin: 0;
-        padding: 0;
-        box-sizing: border-box;
-    }}
-
-    html {{
-        font-size: 16px;
-        scroll-behavior: smooth;
-    }}
-
-    body {{
-        font-family: var(--font-family);
-        background: var(--color-background);
-        color: var(--color-primary);
-        line-height: 1.6;
-        -webkit-font-smoothing: antialiased;
-        -moz-osx-font-smoothing: grayscale;
-    }}
-
-    /* Focus states for accessibility */
-    :focus-visible {{
-        outline: 2px solid var(--color-accent);
-        outline-offset: 2px;
-    }}
-
-    /* Reduced motion support */
-    @media (prefers-reduced-motion: reduce) {{
-        *, *::before, *::after {{
-            animation-duration: 0.01ms !important;
-            animation-iteration-count: 1 !important;
-            transition-duration: 0.01ms !important;
-        }}
-    }}
-
-    /* Typography Scale */
-    .text-display {{
-        font-size: clamp(3rem, 8vw, 5.5rem);
-        font-weight: 300;
-        line-height: 1.05;
-        letter-spacing: -0.03em;
-    }}
-
-    .text-headline {{
-        font-size: clamp(2rem, 5vw, 3rem);
-        font-weight: 400;
-        line-height: 1.15;
-        letter-spacing: -0.02em;
-    }}
-
-    .text-title {{
-        font-size: 1.5rem;
-        font-weight: 500;
-        line-height: 1.3;
-        letter-spacing: -0.01em;
-    }}
-
-    .text-body {{
-        font-size: 1.125rem;
-        font-weight: 400;
-        line-height: 1.6;
-    }}
-
-    .text-small {{
-        font-size: 0.875rem;
-        font-weight: 400;
-        line-height: 1.5;
-    }}
-
-    .text-caption {{
-        font-size: 0.75rem;
-        font-weight: 500;
-        letter-spacing: 0.1em;
-        text-transform: uppercase;
-    }}
-
-    .text-muted {{
-        color: var(--color-muted);
-    }}
-
-    .text-accent {{
-        color: var(--color-accent);
-    }}
-
-    /* Layout Utilities */
-    .container {{
-        width: 100%;
-        max-width: 1200px;
-        margin: 0 auto;
-        padding: 0 1.5rem;
-    }}
-
-    .container-narrow {{
-        max-width: 800px;
-    }}
-
-    /* Motion Primitives - Fade In Up */
-    @keyframes fadeInUp {{
-        from {{
-            opacity: 0;
-            transform: translateY(24px);
-        }}
-        to {{
-            opacity: 1;
-            transform: translateY(0);
-        }}
-    }}
-
-    .animate-fade-in-up {{
-        animation: fadeInUp 0.6s var(--easing) forwards;
-    }}
-
-    .animate-delay-1 {{ animation-delay: 0.1s; opacity: 0; }}
-    .animate-delay-2 {{ animation-delay: 0.2s; opacity: 0; }}
-    .animate-delay-3 {{ animation-delay: 0.3s; opacity: 0; }}
-    .animate-delay-4 {{ animation-delay: 0.4s; opacity: 0; }}
-
-    /* Motion Primitives - Blur In */
-    @keyframes blurIn {{
-        from {{
-            opacity: 0;
-            filter: blur(8px);
-        }}
-        to {{
-            opacity: 1;
-            filter: blur(0);
-        }}
-    }}
-
-    .animate-blur-in {{
-        animation: blurIn 0.8s var(--easing) forwards;
-    }}
-
-    /* Button Component - TweakCN Style */
-    .btn {{
-        display: inline-flex;
-        align-items: center;
-        justify-content: center;
-        gap: 0.5rem;
-        padding: 0.875rem 1.75rem;
-        font-family: var(--font-family);
-        font-size: 0.875rem;
-        font-weight: 600;
-        letter-spacing: 0.025em;
-        text-decoration: none;
-        border: none;
-        border-radius: 0;
-        cursor: pointer;
-        transition: all var(--transition-normal) var(--easing);
-        position: relative;
-        overflow: hidden;
-    }}
-
-    .btn-primary {{
-        background: var(--color-primary);
-        color: var(--color-background);
-    }}
-
-    .btn-primary:hover {{
-        background: var(--color-accent);
-        transform: translateY(-2px);
-    }}
-
-    .btn-primary:active {{
-        transform: translateY(0);
-    }}
-
-    .btn-secondary {{
-        background: transparent;
-        color: var(--color-primary);
-        border: 1px solid var(--color-border);
-    }}
-
-    .btn-secondary:hover {{
-        border-color: var(--color-primary);
-        background: var(--color-primary);
-        color: var(--color-background);
-    }}
-
-    .btn-ghost {{
-        background: transparent;
-        color: var(--color-muted);
-        padding: 0.5rem 1rem;
-    }}
-
-    .btn-ghost:hover {{
-        color: var(--color-primary);
-    }}
-
-    /* Icon styling */
-    .btn svg {{
-        width: 16px;
-        height: 16px;
-        transition: transform var(--transition-fast) var(--easing);
-    }}
-
-    .btn:hover svg {{
-        transform: translateX(4px);
-    }}
-
-    /* Card Component */
-    .card {{
-        background: var(--color-surface);
-        border: 1px solid var(--color-border);
-        padding: 1.5rem;
-        transition: all var(--transition-normal) var(--easing);
-    }}
-
-    .card:hover {{
-        border-color: var(--color-muted);
-    }}
-
-    .card-interactive {{
-        cursor: pointer;
-    }}
-
-    .card-interactive:hover {{
-        transform: translateY(-2px);
-        box-shadow: 0 8px 30px rgba(0, 0, 0, 0.04);
-    }}
-
-    /* Navigation */
-    .nav {{
-        position: fixed;
-        top: 0;
-        left: 0;
-        right: 0;
-        z-index: 100;
-        padding: 1rem 0;
-        background: rgba(250, 250, 250, 0.8);
-        backdrop-filter: blur(12px);
-        -webkit-backdrop-filter: blur(12px);
-        border-bottom: 1px solid transparent;
-        transition: all var(--transition-normal) var(--easing);
-    }}
-
-    .nav.scrolled {{
-        border-bottom-color: var(--color-border);
-    }}
-
-    .nav-inner {{
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }}
-
-    .nav-logo {{
-        font-size: 1.125rem;
-        font-weight: 600;
-        letter-spacing: -0.02em;
-        color: var(--color-primary);
-        text-decoration: none;
-    }}
-
-    .nav-links {{
-        display: flex;
-        align-items: center;
-        gap: 2rem;
-    }}
-
-    .nav-link {{
-        font-size: 0.875rem;
-        font-weight: 500;
-        color: var(--color-muted);
-        text-decoration: none;
-        transition: color var(--transition-fast) var(--easing);
-    }}
-
-    .nav-link:hover {{
-        color: var(--color-primary);
-    }}
-
-    /* Hero Section - Full viewport, single focus */
-    .hero {{
-        min-height: 100vh;
-        display: flex;
-        flex-direction: column;
-        justify-content: center;
-        padding: 6rem 0 4rem;
-        position: relative;
-    }}
-
-    .hero-content {{
-        max-width: 900px;
-    }}
-
-    .hero-badge {{
-        display: inline-flex;
-        align-items: center;
-        gap: 0.5rem;
-        padding: 0.375rem 0.75rem;
-        background: rgba(45, 90, 39, 0.08);
-        color: var(--color-accent);
-        font-size: 0.75rem;
-        font-weight: 600;
-        letter-spacing: 0.05em;
-        text-transform: uppercase;
-        margin-bottom: 1.5rem;
-    }}
-
-    .hero-title {{
-        margin-bottom: 1.5rem;
-    }}
-
-    .hero-title strong {{
-        font-weight: 600;
-    }}
-
-    .hero-description {{
-        max-width: 600px;
-        margin-bottom: 2.5rem;
-    }}
-
-    .hero-cta {{
-        display: flex;
-        gap: 1rem;
-        flex-wrap: wrap;
-    }}
-
-    /* Features Section - Minimal, scannable */
-    .features {{
-        padding: 6rem 0;
-        border-top: 1px solid var(--color-border);
-    }}
-
-    .features-header {{
-        max-width: 600px;
-        margin-bottom: 4rem;
-    }}
-
-    .features-grid {{
-        display: grid;
-        grid-template-columns: repeat(auto-fit, minmax(280px, 1fr));
-        gap: 2rem;
-    }}
-
-    .feature {{
-        padding: 1.5rem 0;
-    }}
-
-    .feature-icon {{
-        width: 40px;
-        height: 40px;
-        margin-bottom: 1rem;
-        color: var(--color-accent);
-    }}
-
-    .feature-title {{
-        font-size: 1rem;
-        font-weight: 600;
-        margin-bottom: 0.5rem;
-    }}
-
-    .feature-description {{
-        font-size: 0.9375rem;
-        color: var(--color-muted);
-        line-height: 1.6;
-    }}
-
-    /* Social Proof Section */
-    .social-proof {{
-        padding: 4rem 0;
-        background: var(--color-surface);
-        border-top: 1px solid var(--color-border);
-        border-bottom: 1px solid var(--color-border);
-    }}
-
-    .social-proof-content {{
-        text-align: center;
-    }}
-
-    .social-proof-stat {{
-        font-size: 3rem;
-        font-weight: 300;
-        letter-spacing: -0.02em;
-        margin-bottom: 0.5rem;
-    }}
-
-    /* Positioning Section - The "Why Different" */
-    .positioning {{
-        padding: 6rem 0;
-    }}
-
-    .positioning-grid {{
-        display: grid;
-        grid-template-columns: 1fr 1fr;
-        gap: 4rem;
-        align-items: start;
-    }}
-
-    .positioning-column {{
-        padding: 2rem;
-    }}
-
-    .positioning-column.them {{
-        background: #f1f5f9;
-        border: 1px solid var(--color-border);
-    }}
-
-    .positioning-column.us {{
-        background: rgba(45, 90, 39, 0.04);
-        border: 1px solid var(--color-accent);
-    }}
-
-    .positioning-label {{
-        font-size: 0.75rem;
-        font-weight: 600;
-        letter-spacing: 0.1em;
-        text-transform: uppercase;
-        margin-bottom: 1rem;
-    }}
-
-    .positioning-column.them .positioning-label {{
-        color: var(--color-muted);
-    }}
-
-    .positioning-column.us .positioning-label {{
-        color: var(--color-accent);
-    }}
-
-    /* CTA Section */
-    .cta-section {{
-        padding: 6rem 0;
-        text-align: center;
-        border-top: 1px solid var(--color-border);
-    }}
-
-    .cta-content {{
-        max-width: 600px;
-        margin: 0 auto;
-    }}
-
-    /* Footer */
-    .footer {{
-        padding: 3rem 0;
-        border-top: 1px solid var(--color-border);
-    }}
-
-    .footer-inner {{
-        display: flex;
-        justify-content: space-between;
-        align-items: center;
-    }}
-
-    .footer-text {{
-        font-size: 0.875rem;
-        color: var(--color-muted);
-    }}
-
-    .footer-links {{
-        display: flex;
-        gap: 1.5rem;
-    }}
-
-    .footer-link {{
-        font-size: 0.875rem;
-        color: var(--color-muted);
-        text-decoration: none;
-        transition: color var(--transition-fast) var(--easing);
-    }}
-
-    .footer-link:hover {{
-        color: var(--color-primary);
-    }}
-
-    /* Responsive */
-    @media (max-width: 768px) {{
-        .nav-links {{
-            display: none;
-        }}
-
-        .hero {{
-            padding: 5rem 0 3rem;
-        }}
-
-        .positioning-grid {{
-            grid-template-columns: 1fr;
-            gap: 2rem;
-        }}
-
-        .footer-inner {{
-            flex-direction: column;
-            gap: 1.5rem;
-            text-align: center;
-        }}
-    }}
-
-    /* Invite Badge - Floating */
-    .invite-badge {{
-        position: fixed;
-        top: 50%;
-        right: -36px;
-        transform: rotate(-90deg) translateX(-50%);
-        background: var(--color-accent);
-        color: white;
-        padding: 0.5rem 1.25rem;
-        font-size: 0.625rem;
-        font-weight: 600;
-        letter-spacing: 0.15em;
-        text-transform: uppercase;
-        z-index: 50;
-    }}
-
-    @media (max-width: 768px) {{
-        .invite-badge {{
-            display: none;
-        }}
-    }}
-
-    /* Form Styles */
-    .form-group {{
-        margin-bottom: 1.5rem;
-    }}
-
-    .form-label {{
-        display: block;
-        font-size: 0.875rem;
-        font-weight: 500;
-        margin-bottom: 0.5rem;
-    }}
-
-    .form-input {{
-        width: 100%;
-        padding: 0.875rem 1rem;
-        font-family: var(--font-family);
-        font-size: 1rem;
-        border: 1px solid var(--color-border);
-        background: var(--color-surface);
-        transition: border-color var(--transition-fast) var(--easing);
-    }}
-
-    .form-input:focus {{
-        outline: none;
-        border-color: var(--color-accent);
-    }}
-
-    .form-input::placeholder {{
-        color: var(--color-muted);
-    }}
-    '''
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+# Everything StaticPage serves is derived from these files, so their newest
+# mtime is a Last-Modified that every worker agrees on
+SOURCE_MTIME = int(max(path.stat().st_mtime for path in (Path(__file__), *TEMPLATES_DIR.iterdir())))
+
+# Templates are parsed and compiled once; nothing is re-read at runtime
+templates = Environment(
+    loader=FileSystemLoader(TEMPLATES_DIR),
+    autoescape=select_autoescape(["html"]),
+    auto_reload=False,
+    cache_size=-1,
+)
+templates.globals["design"] = DESIGN_SYSTEM
 
+HERO_TEMPLATE = templates.get_template("hero.html")
+DASHBOARD_TEMPLATE = templates.get_template("dashboard.html")
+PRICING_TEMPLATE = templates.get_template("pricing.html")
 
-# =============================================================================
-# HERO PAGE - Landing
-# =============================================================================
+def get_base_styles() -> str:
+    """Generate base CSS with design system tokens"""
+    return templates.get_template("base_styles.css").render()
 
 def get_hero_page() -> str:
     """Generate the full-page hero landing page with world-class design"""
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AfroMations | The AI Archive That Finds Your Story</title>
-    <meta name="description" content="Turn years of footage into searchable chapters. AI-powered footage intelligence for documentary creators, cultural archivists, and production teams.">
-    
-    <!-- Fonts -->
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="{DESIGN_SYSTEM["typography"]["font_import"]}" rel="stylesheet">
-    
-    <style>
-        {get_base_styles()}
-    </style>
-</head>
-<body>
-    <!-- Navigation - Minimal, non-intrusive -->
-    <nav class="nav" id="nav">
-        <div class="container">
-            <div class="nav-inner">
-                <a href="/" class="nav-logo">AfroMations</a>
-                <div class="nav-links">
-                    <a href="#features" class="nav-link">Features</a>
-                    <a href="#positioning" class="nav-link">Why Us</a>
-                    <a href="/app" class="btn btn-primary">Request Access</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <!-- Invite Badge -->
-    <div class="invite-badge">Seattle Creators</div>
-
-    <!-- Hero Section - Single dominant focal area -->
-    <section class="hero">
-        <div class="container">
-            <div class="hero-content">
-                <!-- Badge - Establishes context immediately -->
-                <div class="hero-badge animate-fade-in-up">
-                    <svg width="12" height="12" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M12 2L2 7l10 5 10-5-10-5zM2 17l10 5 10-5M2 12l10 5 10-5"/>
-                    </svg>
-                    Footage Intelligence Platform
-                </div>
-                
-                <!-- Headline - The one thing they need to understand -->
-                <h1 class="text-display hero-title animate-fade-in-up animate-delay-1">
-                    Turn years of footage<br>into <strong>searchable chapters</strong>
-                </h1>
-                
-                <!-- Description - Clarifies the value -->
-                <p class="text-body text-muted hero-description animate-fade-in-up animate-delay-2">
-                    The AI archive that finds your story. Index everything you've ever shot, 
-                    search by concept or emotion, and ship compelling content in hours—not weeks.
-                </p>
-                
-                <!-- CTA - One primary action -->
-                <div class="hero-cta animate-fade-in-up animate-delay-3">
-                    <a href="/app" class="btn btn-primary">
-                        Explore
-                        <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                            <path d="M5 12h14M12 5l7 7-7 7"/>
-                        </svg>
-                    </a>
-                    <a href="#features" class="btn btn-secondary">Learn More</a>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Features Section - Scannable, minimal -->
-    <section class="features" id="features">
-        <div class="container">
-            <div class="features-header">
-                <p class="text-caption text-accent" style="margin-bottom: 1rem;">What We Solve</p>
-                <h2 class="text-headline">The footage graveyard problem</h2>
-                <p class="text-body text-muted" style="margin-top: 1rem;">
-                    Documentary creators have terabytes of footage they can't search. 
-                    It sits on hard drives, unsearchable, unusable. We fix that.
-                </p>
-            </div>
-            
-            <div class="features-grid">
-                <!-- Feature 1 -->
-                <div class="feature">
-                    <svg class="feature-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <circle cx="11" cy="11" r="8"/>
-                        <path d="M21 21l-4.35-4.35"/>
-                    </svg>
-                    <h3 class="feature-title">Search Everything</h3>
-                    <p class="feature-description">
-                        "Find every moment someone mentions gentrification" across 5 years of footage. 
-                        Search by concept, emotion, or spoken word.
-                    </p>
-                </div>
-                
-                <!-- Feature 2 -->
-                <div class="feature">
-                    <svg class="feature-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <rect x="3" y="3" width="18" height="18" rx="2"/>
-                        <path d="M3 9h18M9 21V9"/>
-                    </svg>
-                    <h3 class="feature-title">AI Pre-Screening</h3>
-                    <p class="feature-description">
-                        Professional editors spend 60-80% of time in review. 
-                        Our AI surfaces relevant moments, turning weeks into hours.
-                    </p>
-                </div>
-                
-                <!-- Feature 3 -->
-                <div class="feature">
-                    <svg class="feature-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <path d="M12 2a10 10 0 1 0 10 10"/>
-                        <path d="M12 12l4-4"/>
-                        <path d="M16 4v4h4"/>
-                    </svg>
-                    <h3 class="feature-title">Multilingual Pipeline</h3>
-                    <p class="feature-description">
-                        Dual subtitles and AI dubbing in one workflow. 
-                        Reach global audiences without vendor wrangling.
-                    </p>
-                </div>
-                
-                <!-- Feature 4 -->
-                <div class="feature">
-                    <svg class="feature-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <path d="M22 12h-4l-3 9L9 3l-3 9H2"/>
-                    </svg>
-                    <h3 class="feature-title">Viral Scoring</h3>
-                    <p class="feature-description">
-                        Know what will perform before you publish. 
-                        AI-powered predictions and A/B testing for thumbnails and titles.
-                    </p>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Positioning Section - Why we're different -->
-    <section class="positioning" id="positioning">
-        <div class="container">
-            <div class="features-header" style="margin-bottom: 3rem;">
-                <p class="text-caption text-accent" style="margin-bottom: 1rem;">The Difference</p>
-                <h2 class="text-headline">We're not a video editor</h2>
-            </div>
-            
-            <div class="positioning-grid">
-                <div class="positioning-column them">
-                    <p class="positioning-label">Video Editors (CapCut, etc.)</p>
-                    <p class="text-title" style="margin-bottom: 1rem;">"I have a clip, make it pretty"</p>
-                    <ul style="list-style: none; color: var(--color-muted);">
-                        <li style="margin-bottom: 0.5rem;">• Template-driven editing</li>
-                        <li style="margin-bottom: 0.5rem;">• Assumes you know what clip you want</li>
-                        <li style="margin-bottom: 0.5rem;">• Consumer/influencer focused</li>
-                        <li style="margin-bottom: 0.5rem;">• Quick social media clips</li>
-                    </ul>
-                </div>
-                
-                <div class="positioning-column us">
-                    <p class="positioning-label">AfroMations</p>
-                    <p class="text-title" style="margin-bottom: 1rem;">"I have 500 hours, find me the story"</p>
-                    <ul style="list-style: none; color: var(--color-primary);">
-                        <li style="margin-bottom: 0.5rem;">• AI-powered footage discovery</li>
-                        <li style="margin-bottom: 0.5rem;">• Searches your entire archive</li>
-                        <li style="margin-bottom: 0.5rem;">• Production teams & archivists</li>
-                        <li style="margin-bottom: 0.5rem;">• Documentary-grade storytelling</li>
-                    </ul>
-                </div>
-            </div>
-        </div>
-    </section>
-
-    <!-- Social Proof -->
-    <section class="social-proof">
-        <div class="container">
-            <div class="social-proof-content">
-                <p class="text-caption text-muted" style="margin-bottom: 1rem;">Built For</p>
-                <p class="social-proof-stat">Seattle & I-5 Corridor Creators</p>
-                <p class="text-body text-muted">
-                    Documentary filmmakers, cultural archivists, and production teams 
-                    who have too much footage and not enough time.
-                </p>
-            </div>
-        </div>
-    </section>
-
-    <!-- CTA Section -->
-    <section class="cta-section">
-        <div class="container">
-            <div class="cta-content">
-                <p class="text-caption text-accent" style="margin-bottom: 1rem;">Limited Access</p>
-                <h2 class="text-headline" style="margin-bottom: 1rem;">Ready to find your story?</h2>
-                <p class="text-body text-muted" style="margin-bottom: 2rem;">
-                    We're opening access in limited waves to Seattle-area creators. 
-                    Request an invite to join the first cohort.
-                </p>
-                <a href="/app" class="btn btn-primary">
-                    Request Access
-                    <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                        <path d="M5 12h14M12 5l7 7-7 7"/>
-                    </svg>
-                </a>
-            </div>
-        </div>
-    </section>
-
-    <!-- Footer -->
-    <footer class="footer">
-        <div class="container">
-            <div class="footer-inner">
-                <p class="footer-text">© 2024 AfroMations. Built for creators in the I-5 corridor.</p>
-                <div class="footer-links">
-                    <a href="/pricing" class="footer-link">Pricing</a>
-                    <a href="https://github.com/executiveusa/AFRO-CLIPZ" class="footer-link">GitHub</a>
-                </div>
-            </div>
-        </div>
-    </footer>
-
-    <script>
-        // Minimal JS - Navigation scroll effect
-        const nav = document.getElementById('nav');
-        window.addEventListener('scroll', () => {{
-            if (window.scrollY > 50) {{
-                nav.classList.add('scrolled');
-            }} else {{
-                nav.classList.remove('scrolled');
-            }}
-        }});
-
-        // Smooth scroll for anchor links
-        document.querySelectorAll('a[href^="#"]').forEach(anchor => {{
-            anchor.addEventListener('click', function (e) {{
-                e.preventDefault();
-                const target = document.querySelector(this.getAttribute('href'));
-                if (target) {{
-                    target.scrollIntoView({{ behavior: 'smooth', block: 'start' }});
-                }}
-            }});
-        }});
-    </script>
-</body>
-</html>'''
-
-
-# =============================================================================
-# APP DASHBOARD - Clean, minimal, one action per view
-# =============================================================================
+    return HERO_TEMPLATE.render()
+
+def get_app_dashboard(projects: Sequence[Dict[str, Any]] = ()) -> str:
+    """Generate the app dashboard with world-class design
+
+    Only one of the project grid (title, updated, status, hours_indexed,
+    clips_found per project) or the empty state is rendered.
+    """
+    return DASHBOARD_TEMPLATE.render(projects=projects)
+
+# Pricing cards, in display order; the featured plan gets the primary button
+PLANS: List[Dict[str, Any]] = [
+    {
+        "name": "Creator Pro",
+        "description": "Your AI assistant editor + localization studio",
+        "amount": "$200",
+        "period": "/month, billed annually",
+        "features": [
+            "600 minutes of video/month",
+            "AI transcription & search",
+            "Smart clipping",
+            "Dual subtitles (2 languages)",
+            "3 team seats",
+        ],
+        "cta_href": "/app",
+        "cta_label": "Request Access",
+        "featured": False,
+    },
+    {
+        "name": "Studio",
+        "description": "Pixar-style departments in a box",
+        "amount": "$800",
+        "period": "/month, billed annually",
+        "features": [
+            "3,000 minutes of video/month",
+            "Everything in Creator Pro",
+            "AI dubbing (2 languages)",
+            "Viral scoring & ranking",
+            "YouTube publishing",
+            "10 team seats",
+        ],
+        "cta_href": "/app",
+        "cta_label": "Request Access",
+        "featured": True,
+    },
+    {
+        "name": "Black Label",
+        "description": "Autonomous studio ops + private deployment",
+        "amount": "Custom",
+        "period": "starting at $3,000/month",
+        "features": [
+            "Unlimited video processing",
+            "Everything in Studio",
+            "Dedicated deployment",
+            "Custom AI agents",
+            "White-label option",
+            "SLA support",
+        ],
+        "cta_href": "mailto:hello@afromations.com",
+        "cta_label": "Contact Us",
+        "featured": False,
+    },
+]
 
-def get_app_dashboard() -> str:
-    """Generate the app dashboard with world-class design"""
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Dashboard | AfroMations</title>
-    
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="{DESIGN_SYSTEM["typography"]["font_import"]}" rel="stylesheet">
-    
-    <style>
-        {get_base_styles()}
-        
-        /* Dashboard-specific styles */
-        .dashboard {{
-            min-height: 100vh;
-            padding-top: 5rem;
-        }}
-        
-        .dashboard-header {{
-            padding: 3rem 0;
-            border-bottom: 1px solid var(--color-border);
-        }}
-        
-        .dashboard-header-inner {{
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-        }}
-        
-        .dashboard-content {{
-            padding: 3rem 0;
-        }}
-        
-        /* Empty State - The hero of the dashboard */
-        .empty-state {{
-            text-align: center;
-            padding: 6rem 2rem;
-            max-width: 500px;
-            margin: 0 auto;
-        }}
-        
-        .empty-state-icon {{
-            width: 64px;
-            height: 64px;
-            margin: 0 auto 1.5rem;
-            color: var(--color-muted);
-            opacity: 0.5;
-        }}
-        
-        /* Project Grid */
-        .projects-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fill, minmax(320px, 1fr));
-            gap: 1.5rem;
-        }}
-        
-        .project-card {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            padding: 1.5rem;
-            cursor: pointer;
-            transition: all var(--transition-normal) var(--easing);
-        }}
-        
-        .project-card:hover {{
-            border-color: var(--color-accent);
-            transform: translateY(-2px);
-            box-shadow: 0 8px 30px rgba(0, 0, 0, 0.04);
-        }}
-        
-        .project-card-header {{
-            display: flex;
-            justify-content: space-between;
-            align-items: flex-start;
-            margin-bottom: 1rem;
-        }}
-        
-        .project-card-title {{
-            font-size: 1.125rem;
-            font-weight: 600;
-            margin-bottom: 0.25rem;
-        }}
-        
-        .project-card-meta {{
-            font-size: 0.875rem;
-            color: var(--color-muted);
-        }}
-        
-        .project-card-stats {{
-            display: flex;
-            gap: 1.5rem;
-            margin-top: 1rem;
-            padding-top: 1rem;
-            border-top: 1px solid var(--color-border);
-        }}
-        
-        .project-stat {{
-            font-size: 0.875rem;
-        }}
-        
-        .project-stat-value {{
-            font-weight: 600;
-            color: var(--color-primary);
-        }}
-        
-        .project-stat-label {{
-            color: var(--color-muted);
-        }}
-        
-        /* Upload Zone */
-        .upload-zone {{
-            border: 2px dashed var(--color-border);
-            padding: 3rem;
-            text-align: center;
-            cursor: pointer;
-            transition: all var(--transition-normal) var(--easing);
-        }}
-        
-        .upload-zone:hover {{
-            border-color: var(--color-accent);
-            background: rgba(45, 90, 39, 0.02);
-        }}
-        
-        .upload-zone-icon {{
-            width: 48px;
-            height: 48px;
-            margin: 0 auto 1rem;
-            color: var(--color-muted);
-        }}
-    </style>
-</head>
-<body>
-    <!-- Navigation -->
-    <nav class="nav scrolled">
-        <div class="container">
-            <div class="nav-inner">
-                <a href="/" class="nav-logo">AfroMations</a>
-                <div class="nav-links">
-                    <a href="/app" class="nav-link" style="color: var(--color-primary);">Projects</a>
-                    <a href="/app/library" class="nav-link">Library</a>
-                    <a href="/app/settings" class="nav-link">Settings</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <main class="dashboard">
-        <div class="container">
-            <!-- Dashboard Header -->
-            <div class="dashboard-header">
-                <div class="dashboard-header-inner">
-                    <div>
-                        <h1 class="text-headline">Projects</h1>
-                        <p class="text-body text-muted">Your footage archives and clip projects</p>
-                    </div>
-                    <button class="btn btn-primary" onclick="showNewProject()">
-                        <svg width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                            <path d="M12 5v14M5 12h14"/>
-                        </svg>
-                        New Project
-                    </button>
-                </div>
-            </div>
-            
-            <!-- Dashboard Content -->
-            <div class="dashboard-content">
-                <!-- Empty State (shown when no projects) -->
-                <div class="empty-state" id="emptyState">
-                    <svg class="empty-state-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <rect x="3" y="3" width="18" height="18" rx="2"/>
-                        <path d="M3 9h18"/>
-                        <path d="M9 21V9"/>
-                    </svg>
-                    <h2 class="text-title" style="margin-bottom: 0.5rem;">No projects yet</h2>
-                    <p class="text-body text-muted" style="margin-bottom: 1.5rem;">
-                        Create your first project to start indexing footage and finding stories.
-                    </p>
-                    <button class="btn btn-primary" onclick="showNewProject()">
-                        Create First Project
-                    </button>
-                </div>
-                
-                <!-- Projects Grid (hidden when empty) -->
-                <div class="projects-grid" id="projectsGrid" style="display: none;">
-                    <!-- Sample Project Card -->
-                    <div class="project-card card-interactive">
-                        <div class="project-card-header">
-                            <div>
-                                <h3 class="project-card-title">Seattle Documentary 2024</h3>
-                                <p class="project-card-meta">Updated 2 hours ago</p>
-                            </div>
-                            <span class="text-caption" style="color: var(--color-accent);">Active</span>
-                        </div>
-                        <div class="project-card-stats">
-                            <div class="project-stat">
-                                <span class="project-stat-value">47</span>
-                                <span class="project-stat-label"> hours indexed</span>
-                            </div>
-                            <div class="project-stat">
-                                <span class="project-stat-value">12</span>
-                                <span class="project-stat-label"> clips found</span>
-                            </div>
-                        </div>
-                    </div>
-                </div>
-            </div>
-        </div>
-    </main>
-
-    <!-- New Project Modal (hidden by default) -->
-    <div id="newProjectModal" style="display: none; position: fixed; inset: 0; background: rgba(0,0,0,0.5); z-index: 200; align-items: center; justify-content: center;">
-        <div style="background: var(--color-surface); padding: 2rem; max-width: 500px; width: 90%; margin: 2rem;">
-            <h2 class="text-title" style="margin-bottom: 1.5rem;">New Project</h2>
-            
-            <div class="form-group">
-                <label class="form-label" for="projectName">Project Name</label>
-                <input type="text" id="projectName" class="form-input" placeholder="e.g., Seattle Documentary 2024">
-            </div>
-            
-            <div class="form-group">
-                <label class="form-label">Upload Footage</label>
-                <div class="upload-zone">
-                    <svg class="upload-zone-icon" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="1.5">
-                        <path d="M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4"/>
-                        <polyline points="17 8 12 3 7 8"/>
-                        <line x1="12" y1="3" x2="12" y2="15"/>
-                    </svg>
-                    <p class="text-body">Drop video files here or click to browse</p>
-                    <p class="text-small text-muted">MP4, MOV, AVI up to 10GB</p>
-                </div>
-            </div>
-            
-            <div style="display: flex; gap: 1rem; justify-content: flex-end; margin-top: 2rem;">
-                <button class="btn btn-secondary" onclick="hideNewProject()">Cancel</button>
-                <button class="btn btn-primary">Create Project</button>
-            </div>
-        </div>
-    </div>
-
-    <script>
-        function showNewProject() {{
-            document.getElementById('newProjectModal').style.display = 'flex';
-        }}
-        
-        function hideNewProject() {{
-            document.getElementById('newProjectModal').style.display = 'none';
-        }}
-        
-        // Close modal on backdrop click
-        document.getElementById('newProjectModal').addEventListener('click', function(e) {{
-            if (e.target === this) hideNewProject();
-        }});
-    </script>
-</body>
-</html>'''
+def get_pricing_page() -> str:
+    """Generate the pricing page"""
+    return PRICING_TEMPLATE.render(plans=PLANS)
 
 
 # =============================================================================
-# PRICING PAGE
+# BUILD-TIME MINIFICATION
 # =============================================================================
 
-def get_pricing_page() -> str:
-    """Generate the pricing page"""
-    return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Pricing | AfroMations</title>
-    
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="{DESIGN_SYSTEM["typography"]["font_import"]}" rel="stylesheet">
-    
-    <style>
-        {get_base_styles()}
-        
-        .pricing {{
-            padding: 8rem 0 4rem;
-        }}
-        
-        .pricing-header {{
-            text-align: center;
-            max-width: 600px;
-            margin: 0 auto 4rem;
-        }}
-        
-        .pricing-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 2rem;
-            max-width: 1000px;
-            margin: 0 auto;
-        }}
-        
-        .pricing-card {{
-            background: var(--color-surface);
-            border: 1px solid var(--color-border);
-            padding: 2rem;
-            display: flex;
-            flex-direction: column;
-        }}
-        
-        .pricing-card.featured {{
-            border-color: var(--color-accent);
-            position: relative;
-        }}
-        
-        .pricing-card.featured::before {{
-            content: 'Most Popular';
-            position: absolute;
-            top: -12px;
-            left: 50%;
-            transform: translateX(-50%);
-            background: var(--color-accent);
-            color: white;
-            padding: 0.25rem 0.75rem;
-            font-size: 0.75rem;
-            font-weight: 600;
-            letter-spacing: 0.05em;
-            text-transform: uppercase;
-        }}
-        
-        .pricing-card-header {{
-            margin-bottom: 1.5rem;
-        }}
-        
-        .pricing-card-name {{
-            font-size: 1.25rem;
-            font-weight: 600;
-            margin-bottom: 0.5rem;
-        }}
-        
-        .pricing-card-description {{
-            font-size: 0.9375rem;
-            color: var(--color-muted);
-        }}
-        
-        .pricing-card-price {{
-            margin-bottom: 1.5rem;
-        }}
-        
-        .pricing-amount {{
-            font-size: 3rem;
-            font-weight: 300;
-            letter-spacing: -0.02em;
-        }}
-        
-        .pricing-period {{
-            font-size: 0.875rem;
-            color: var(--color-muted);
-        }}
-        
-        .pricing-features {{
-            list-style: none;
-            margin-bottom: 2rem;
-            flex-grow: 1;
-        }}
-        
-        .pricing-features li {{
-            padding: 0.5rem 0;
-            font-size: 0.9375rem;
-            display: flex;
-            align-items: center;
-            gap: 0.75rem;
-        }}
-        
-        .pricing-features li svg {{
-            width: 16px;
-            height: 16px;
-            color: var(--color-accent);
-            flex-shrink: 0;
-        }}
-        
-        .pricing-note {{
-            text-align: center;
-            margin-top: 3rem;
-            padding-top: 2rem;
-            border-top: 1px solid var(--color-border);
-        }}
-    </style>
-</head>
-<body>
-    <!-- Navigation -->
-    <nav class="nav" id="nav">
-        <div class="container">
-            <div class="nav-inner">
-                <a href="/" class="nav-logo">AfroMations</a>
-                <div class="nav-links">
-                    <a href="/#features" class="nav-link">Features</a>
-                    <a href="/pricing" class="nav-link" style="color: var(--color-primary);">Pricing</a>
-                    <a href="/app" class="btn btn-primary">Request Access</a>
-                </div>
-            </div>
-        </div>
-    </nav>
-
-    <main class="pricing">
-        <div class="container">
-            <div class="pricing-header">
-                <p class="text-caption text-accent" style="margin-bottom: 1rem;">Pricing</p>
-                <h1 class="text-headline" style="margin-bottom: 1rem;">Outcomes, not features</h1>
-                <p class="text-body text-muted">
-                    Annual plans only. We're building for serious creators who want results, 
-                    not another monthly subscription to forget about.
-                </p>
-            </div>
-            
-            <div class="pricing-grid">
-                <!-- Creator Pro -->
-                <div class="pricing-card">
-                    <div class="pricing-card-header">
-                        <h2 class="pricing-card-name">Creator Pro</h2>
-                        <p class="pricing-card-description">Your AI assistant editor + localization studio</p>
-                    </div>
-                    <div class="pricing-card-price">
-                        <span class="pricing-amount">$200</span>
-                        <span class="pricing-period">/month, billed annually</span>
-                    </div>
-                    <ul class="pricing-features">
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            600 minutes of video/month
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            AI transcription & search
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Smart clipping
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Dual subtitles (2 languages)
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            3 team seats
-                        </li>
-                    </ul>
-                    <a href="/app" class="btn btn-secondary" style="width: 100%;">Request Access</a>
-                </div>
-                
-                <!-- Studio -->
-                <div class="pricing-card featured">
-                    <div class="pricing-card-header">
-                        <h2 class="pricing-card-name">Studio</h2>
-                        <p class="pricing-card-description">Pixar-style departments in a box</p>
-                    </div>
-                    <div class="pricing-card-price">
-                        <span class="pricing-amount">$800</span>
-                        <span class="pricing-period">/month, billed annually</span>
-                    </div>
-                    <ul class="pricing-features">
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            3,000 minutes of video/month
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Everything in Creator Pro
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            AI dubbing (2 languages)
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Viral scoring & ranking
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            YouTube publishing
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            10 team seats
-                        </li>
-                    </ul>
-                    <a href="/app" class="btn btn-primary" style="width: 100%;">Request Access</a>
-                </div>
-                
-                <!-- Black Label -->
-                <div class="pricing-card">
-                    <div class="pricing-card-header">
-                        <h2 class="pricing-card-name">Black Label</h2>
-                        <p class="pricing-card-description">Autonomous studio ops + private deployment</p>
-                    </div>
-                    <div class="pricing-card-price">
-                        <span class="pricing-amount">Custom</span>
-                        <span class="pricing-period">starting at $3,000/month</span>
-                    </div>
-                    <ul class="pricing-features">
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Unlimited video processing
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Everything in Studio
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Dedicated deployment
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            Custom AI agents
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            White-label option
-                        </li>
-                        <li>
-                            <svg viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2">
-                                <polyline points="20 6 9 17 4 12"/>
-                            </svg>
-                            SLA support
-                        </li>
-                    </ul>
-                    <a href="mailto:hello@afromations.com" class="btn btn-secondary" style="width: 100%;">Contact Us</a>
-                </div>
-            </div>
-            
-            <div class="pricing-note">
-                <p class="text-body text-muted">
-                    All plans require an invite. We're opening access in limited waves to ensure quality.
-                </p>
-            </div>
-        </div>
-    </main>
-
-    <!-- Footer -->
-    <footer class="footer">
-        <div class="container">
-            <div class="footer-inner">
-                <p class="footer-text">© 2024 AfroMations. Built for creators in the I-5 corridor.</p>
-                <div class="footer-links">
-                    <a href="/" class="footer-link">Home</a>
-                    <a href="https://github.com/executiveusa/AFRO-CLIPZ" class="footer-link">GitHub</a>
-                </div>
-            </div>
-        </div>
-    </footer>
-
-    <script>
-        const nav = document.getElementById('nav');
-        window.addEventListener('scroll', () => {{
-            if (window.scrollY > 50) {{
-                nav.classList.add('scrolled');
-            }} else {{
-                nav.classList.remove('scrolled');
-            }}
-        }});
-    </script>
-</body>
-</html>'''
+_STYLE_BLOCK_RE = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S | re.I)
+_SCRIPT_BLOCK_RE = re.compile(r"(<script[^>]*>)(.*?)(</script>)", re.S | re.I)
+_CSS_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_CSS_PUNCT_RE = re.compile(r"\s*([{};,>])\s*")
+_HTML_COMMENT_RE = re.compile(r"<!--(?!\[if).*?-->", re.S)
+
+def minify_css(css: str) -> str:
+    """Drop comments and formatting whitespace from a stylesheet"""
+    css = _CSS_COMMENT_RE.sub("", css)
+    css = re.sub(r"\s+", " ", css)
+    css = _CSS_PUNCT_RE.sub(r"\1", css)
+    css = re.sub(r":\s+", ":", css)  # declarations; selectors never have ": x"
+    return css.replace(";}", "}").strip()
+
+def minify_js(js: str) -> str:
+    """Drop indentation, blank lines and whole-line comments (newlines kept for ASI)"""
+    lines = (line.strip() for line in js.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+def minify_html(html: str) -> str:
+    """Minify a page once at import: inline CSS/JS, comments and whitespace runs"""
+    blocks: List[str] = []
+
+    def stash(match: "re.Match[str]", minify) -> str:
+        blocks.append(match.group(1) + minify(match.group(2)) + match.group(3))
+        return f"\x00{len(blocks) - 1}\x00"
+
+    html = _STYLE_BLOCK_RE.sub(lambda m: stash(m, minify_css), html)
+    html = _SCRIPT_BLOCK_RE.sub(lambda m: stash(m, minify_js), html)
+    html = _HTML_COMMENT_RE.sub("", html)
+    # Runs of whitespace render as one space outside <pre>/<textarea>,
+    # and none of the pages use either
+    html = re.sub(r"\s+", " ", html)
+    return re.sub(r"\x00(\d+)\x00", lambda m: blocks[int(m.group(1))], html).strip()
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, bool]:
+    """Each content coding the client lists, and whether it is accepted (not q=0)"""
+    codings = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.partition(";")
+        name, _, value = params.strip().partition("=")
+        try:
+            codings[coding.strip()] = not (name.strip() == "q" and float(value) <= 0)
+        except ValueError:
+            continue
+    return codings
+
+def accepts_coding(codings: Dict[str, bool], coding: str) -> bool:
+    """An explicit entry for a coding, q=0 included, overrides the "*" wildcard"""
+    return codings.get(coding, codings.get("*", False))
+
+def json_error(status_code: int, body: bytes) -> Response:
+    """Response for a constant error whose JSON was encoded at import
+
+    Built per reply rather than cached: middleware edits response headers in
+    place, so a shared Response would leak them across requests.
+    """
+    return Response(body, status_code=status_code, media_type="application/json")
+
+def _raw_headers(headers: Dict[str, str]) -> tuple:
+    return tuple((name.encode("latin-1"), value.encode("latin-1")) for name, value in headers.items())
+
+async def send_prebuilt(send, status: int, headers: tuple, body: bytes = b"") -> None:
+    """Send a precomputed response
+
+    Middleware (CORS, GZip) edits the messages it sees in place, so every
+    response gets fresh message dicts and a fresh header list; only the
+    encoded bytes are shared.
+    """
+    await send({"type": "http.response.start", "status": status, "headers": list(headers)})
+    await send({"type": "http.response.body", "body": body})
+
+class StaticPage:
+    """A page or stylesheet that never changes at runtime, precompressed with validators precomputed
+
+    Instances are plain ASGI apps: a hit parses two headers and sends two
+    prebuilt messages, with no Request/Response objects or threadpool hop.
+    """
+
+    def __init__(self, body: bytes, media_type: str = "text/html; charset=utf-8",
+                 cache_control: str = "public, max-age=3600, must-revalidate",
+                 extra_headers: Optional[Dict[str, str]] = None, last_modified: int = SOURCE_MTIME) -> None:
+        self.body = body
+        self.last_modified = last_modified
+        self.digest = digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+
+        encoded = {"identity": body, "gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=11, mode=brotli.MODE_TEXT)
+
+        # coding -> (etag, 200 headers, payload, 304 headers);
+        # each coding is its own representation, so each gets its own strong ETag
+        self.variants: Dict[str, tuple] = {}
+        for coding, payload in encoded.items():
+            etag = f'"{digest}"' if coding == "identity" else f'"{digest}-{coding}"'
+            not_modified = {
+                "etag": etag,
+                "last-modified": formatdate(last_modified, usegmt=True),
+                "cache-control": cache_control,
+                "vary": "accept-encoding",
+            }
+            headers = {**not_modified, "content-type": media_type, "content-length": str(len(payload))}
+            if extra_headers:
+                headers.update(extra_headers)
+            if coding != "identity":
+                headers["content-encoding"] = coding
+            self.variants[coding] = (etag, _raw_headers(headers), payload, _raw_headers(not_modified))
+        self.etag = self.variants["identity"][0]
+
+    def select(self, accept_encoding: str) -> tuple:
+        """Pick the smallest representation the client accepts"""
+        codings = parse_accept_encoding(accept_encoding)
+        if "br" in self.variants and accepts_coding(codings, "br"):
+            return self.variants["br"]
+        if accepts_coding(codings, "gzip"):
+            return self.variants["gzip"]
+        return self.variants["identity"]
+
+    @staticmethod
+    def is_fresh(if_none_match: str, etag: str) -> bool:
+        """True when the client's If-None-Match already names this representation"""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        return any(
+            tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(",")
+        )
+
+    def not_modified_since(self, if_modified_since: str) -> bool:
+        """True when an If-Modified-Since date is no older than Last-Modified"""
+        try:
+            return parsedate_to_datetime(if_modified_since).timestamp() >= self.last_modified
+        except (TypeError, ValueError):
+            return False
+
+    async def __call__(self, scope, receive, send) -> None:
+        accept_encoding = if_none_match = if_modified_since = ""
+        for name, value in scope["headers"]:
+            if name == b"accept-encoding":
+                accept_encoding = value.decode("latin-1")
+            elif name == b"if-none-match":
+                if_none_match = value.decode("latin-1")
+            elif name == b"if-modified-since":
+                if_modified_since = value.decode("latin-1")
+
+        etag, headers, payload, not_modified = self.select(accept_encoding)
+        # If-None-Match wins when present; the date is only a fallback
+        # for caches that do not keep ETags (RFC 9110, 13.2.2)
+        if (self.is_fresh(if_none_match, etag) if if_none_match
+                else if_modified_since and self.not_modified_since(if_modified_since)):
+            await send_prebuilt(send, 304, not_modified)
+            return
+        # HEAD gets the same precomputed Content-Length/ETag, but no body
+        await send_prebuilt(send, 200, headers, b"" if scope["method"] == "HEAD" else payload)
+
+# For URLs that embed a hash of their content: a new version is a new URL
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+
+# The design-system stylesheet is shared by every page: serve it once under a
+# content-hashed URL so browsers cache it for good instead of per page
+BASE_STYLESHEET = StaticPage(
+    minify_css(get_base_styles()).encode("utf-8"),
+    media_type="text/css; charset=utf-8",
+    cache_control=IMMUTABLE_CACHE,
+)
+BASE_CSS_URL = f"/static/base.{BASE_STYLESHEET.digest[:12]}.css"
+templates.globals["base_css_url"] = BASE_CSS_URL
+
+# Icons are <symbol>s in one sprite; pages only carry <use href="...#name">
+ICON_SPRITE = StaticPage(
+    re.sub(r">\s+<", "><", templates.get_template("icons.svg").render()).strip().encode("utf-8"),
+    media_type="image/svg+xml",
+    cache_control=IMMUTABLE_CACHE,
+)
+ICONS_URL = f"/static/icons.{ICON_SPRITE.digest[:12]}.svg"
+templates.globals["icons_url"] = ICONS_URL
+
+# Page behaviour is one deferred script shared by every page
+APP_SCRIPT = StaticPage(
+    minify_js(templates.get_template("app.js").render()).encode("utf-8"),
+    media_type="text/javascript; charset=utf-8",
+    cache_control=IMMUTABLE_CACHE,
+)
+APP_JS_URL = f"/static/app.{APP_SCRIPT.digest[:12]}.js"
+templates.globals["app_js_url"] = APP_JS_URL
+
+# Pages never change at runtime: build and encode each one once at import
+_HERO_HTML: bytes = minify_html(get_hero_page()).encode("utf-8")
+_DASHBOARD_HTML: bytes = minify_html(get_app_dashboard()).encode("utf-8")
+_PRICING_HTML: bytes = minify_html(get_pricing_page()).encode("utf-8")
+
+# The same subresources the <head> preloads, as a Link header: browsers can
+# start on them before parsing, and CDNs that support it (e.g. Cloudflare)
+# turn it into a 103 Early Hints response, which uvicorn cannot send itself
+PAGE_LINK = ", ".join((
+    f"<{BASE_CSS_URL}>; rel=preload; as=style",
+    f"<{DESIGN_SYSTEM['typography']['font_import']}>; rel=preload; as=style",
+    "<https://fonts.gstatic.com>; rel=preconnect; crossorigin",
+))
+
+# All page behaviour lives in the external app.js bundle and the templates
+# have no inline <script> or on* handlers, so scripts are locked to our own
+# origin; styles still need 'unsafe-inline' for the style="" attributes
+PAGE_CSP = "; ".join((
+    "default-src 'self'",
+    "script-src 'self'",
+    "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com",
+    "font-src https://fonts.gstatic.com",
+    "img-src 'self' data:",
+    "object-src 'none'",
+    "base-uri 'none'",
+    "form-action 'self'",
+    "frame-ancestors 'none'",
+))
+PAGE_HEADERS = {"link": PAGE_LINK, "content-security-policy": PAGE_CSP}
+
+HERO_PAGE = StaticPage(_HERO_HTML, extra_headers=PAGE_HEADERS)
+DASHBOARD_PAGE = StaticPage(_DASHBOARD_HTML, extra_headers=PAGE_HEADERS)
+PRICING_PAGE = StaticPage(_PRICING_HTML, extra_headers=PAGE_HEADERS)
 
 
 # =============================================================================
 # API ROUTES
 # =============================================================================
 
-@app.get("/", response_class=HTMLResponse)
-async def home():
-    """Serve the hero landing page"""
-    return get_hero_page()
-
-@app.get("/app", response_class=HTMLResponse)
-async def dashboard():
-    """Serve the app dashboard"""
-    return get_app_dashboard()
-
-@app.get("/pricing", response_class=HTMLResponse)
-async def pricing():
-    """Serve the pricing page"""
-    return get_pricing_page()
+class AssetFiles(StaticFiles):
+    """StaticFiles with caching headers
+
+    Files named like "name.<hex digest>.ext" are cached for good; the manifest
+    (rewritten on every organizer run) is always revalidated; anything else is
+    reused for an hour, then revalidated against Starlette's ETag.
+    """
+
+    HASHED_NAME = re.compile(r"\.[0-9a-f]{8,64}\.[0-9A-Za-z]+$")
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        name = os.path.basename(full_path)
+        if self.HASHED_NAME.search(name):
+            response.headers["cache-control"] = IMMUTABLE_CACHE
+        elif name == "manifest.json":
+            response.headers["cache-control"] = "no-cache"
+        else:
+            response.headers["cache-control"] = "public, max-age=3600, must-revalidate"
+        return response
+
+# Organized media (tools/organize_assets.py) is plain files on disk: let
+# StaticFiles stream it with ETag/Last-Modified handled by Starlette
+ASSETS_DIR = Path(__file__).resolve().parent / "assets"
+app.mount("/assets", AssetFiles(directory=ASSETS_DIR, check_dir=False), name="assets")
+
+# Pages are mounted as raw ASGI endpoints (hero landing, app dashboard, pricing)
+app.router.add_route(BASE_CSS_URL, BASE_STYLESHEET, methods=["GET"], name="base_css", include_in_schema=False)
+app.router.add_route(ICONS_URL, ICON_SPRITE, methods=["GET"], name="icons", include_in_schema=False)
+app.router.add_route(APP_JS_URL, APP_SCRIPT, methods=["GET"], name="app_js", include_in_schema=False)
+app.router.add_route("/", HERO_PAGE, methods=["GET"], name="home", include_in_schema=False)
+app.router.add_route("/app", DASHBOARD_PAGE, methods=["GET"], name="dashboard", include_in_schema=False)
+app.router.add_route("/pricing", PRICING_PAGE, methods=["GET"], name="pricing", include_in_schema=False)
+
+# Env config is fixed after boot, so integration status is computed once
+HEALTH_CONFIG = {
+    "auth_configured": settings.is_configured("GOOGLE_CLIENT_ID", "GOOGLE_CLIENT_SECRET"),
+    "billing_configured": settings.is_configured("LEMON_SQUEEZY_API_KEY", "LEMON_SQUEEZY_STORE_ID"),
+    "db_configured": settings.is_configured("SUPABASE_URL", "SUPABASE_ANON_KEY"),
+    "ai_configured": settings.is_configured("GROQ_API_KEY"),
+}
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint"""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "version": "2.0.0",
-        "design_system": "motion-primitives-inspired"
-    }
+# Verbose health body: everything but the timestamp is constant, so
+# serialize once and split around it
+_HEALTH_PREFIX, _HEALTH_SUFFIX = orjson.dumps({
+    "status": "healthy",
+    "timestamp": "__TS__",
+    "version": "2.0.0",
+    "design_system": "motion-primitives-inspired",
+    "config": HEALTH_CONFIG,
+}).split(b"__TS__")
+
+# [epoch second, formatted UTC timestamp]: reformatted at most once a second
+_TS_CACHE: List[Any] = [0, b""]
+
+def utc_timestamp() -> bytes:
+    now = int(time.time())
+    cache = _TS_CACHE
+    if cache[0] != now:
+        cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now)).encode()
+        cache[0] = now
+    return cache[1]
+
+class HealthCheck:
+    """Health check endpoint (raw ASGI: no dependency solving or Response per probe)
+
+    Probes get a constant body; the integration status block is only sent for
+    ?verbose=1 with "Authorization: Bearer $HEALTH_TOKEN".
+    """
+
+    HEADERS = ((b"content-type", b"application/json"), (b"cache-control", b"no-store"))
+    OK_BODY = b'{"status":"healthy"}'
+    OK_HEADERS = (*HEADERS, (b"content-length", str(len(OK_BODY)).encode()))
+    EXPECTED_AUTH = f"Bearer {settings.HEALTH_TOKEN}".encode() if settings.HEALTH_TOKEN else None
+
+    def is_verbose(self, scope) -> bool:
+        if self.EXPECTED_AUTH is None or not scope["query_string"]:
+            return False
+        if ("verbose", "1") not in parse_qsl(scope["query_string"].decode("latin-1")):
+            return False
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                return secrets.compare_digest(value, self.EXPECTED_AUTH)
+        return False
+
+    async def __call__(self, scope, receive, send) -> None:
+        if not self.is_verbose(scope):
+            await send_prebuilt(send, 200, self.OK_HEADERS, b"" if scope["method"] == "HEAD" else self.OK_BODY)
+            return
+        body = b"".join((_HEALTH_PREFIX, utc_timestamp(), _HEALTH_SUFFIX))
+        await send_prebuilt(send, 200, (*self.HEADERS, (b"content-length", str(len(body)).encode())),
+                            b"" if scope["method"] == "HEAD" else body)
+
+app.router.add_route("/api/health", HealthCheck(), methods=["GET"], name="health_check", include_in_schema=False)
 
 @app.post("/api/invite/request")
 async def request_invite(request: InviteRequest):
     """Request an invite to the platform"""
-    invite_id = hashlib.sha256(f"{request.email}{datetime.utcnow().isoformat()}".encode()).hexdigest()[:12]
-    invites[invite_id] = {
+    invite_id = secrets.token_hex(6)  # 12 hex chars; random, so not derivable from the email
+    await store.set("invites", invite_id, {
         "email": request.email,
         "name": request.name,
         "company": request.company,
         "use_case": request.use_case,
         "status": "pending",
-        "created_at": datetime.utcnow().isoformat()
-    }
+        "created_at": utc_now_iso()
+    })
     return {
         "success": True,
         "message": "Invite request received. We'll be in touch soon.",
         "request_id": invite_id
     }
 
+SUBSCRIPTION_EVENTS = frozenset({
+    "subscription_created",
+    "subscription_updated",
+    "subscription_cancelled",
+    "subscription_resumed",
+    "subscription_expired",
+})
+
+async def record_subscription(event_name: str, data: Dict[str, Any]) -> None:
+    """Keep the latest known state of a Lemon Squeezy subscription"""
+    attributes = data.get("attributes", {})
+    await store.set("subscriptions", str(data.get("id")), {
+        "status": attributes.get("status"),
+        "user_email": attributes.get("user_email"),
+        "variant_id": attributes.get("variant_id"),
+        "renews_at": attributes.get("renews_at"),
+        "ends_at": attributes.get("ends_at"),
+        "last_event": event_name,
+        "updated_at": utc_now_iso(),
+    })
+
+# Verified events are acknowledged immediately and applied by one worker task,
+# so provider-facing latency is just signature check + enqueue
+webhook_queue: "asyncio.Queue[tuple]" = asyncio.Queue(maxsize=10_000)
+# Event ids queued but not yet applied, so a retry arriving meanwhile is not queued twice
+webhook_pending: set = set()
+# The delivery was already answered 200, so Lemon Squeezy will not resend an
+# event that fails to apply: the worker retries it here, backing off per attempt
+WEBHOOK_APPLY_ATTEMPTS = 3
+WEBHOOK_RETRY_DELAY_SECONDS = 1.0
+
+async def apply_webhook_event(event_id: str, event_name: str, data: Dict[str, Any]) -> None:
+    for attempt in range(1, WEBHOOK_APPLY_ATTEMPTS + 1):
+        try:
+            await record_subscription(event_name, data)
+            # Only an applied event counts as seen, so a failed one stays
+            # eligible for a manual resend from the Lemon Squeezy dashboard
+            await store.set("webhook_events", event_id, {"event_name": event_name},
+                            ttl=WEBHOOK_DEDUP_TTL_SECONDS)
+            return
+        except Exception as e:
+            print(f"⚠️  Webhook {event_name} for {data.get('id')} failed "
+                  f"(attempt {attempt}/{WEBHOOK_APPLY_ATTEMPTS}): {e}")
+            if attempt < WEBHOOK_APPLY_ATTEMPTS:
+                await asyncio.sleep(WEBHOOK_RETRY_DELAY_SECONDS * attempt)
+
+async def webhook_worker() -> None:
+    while True:
+        event_id, event_name, data = await webhook_queue.get()
+        try:
+            await apply_webhook_event(event_id, event_name, data)
+        finally:
+            webhook_pending.discard(event_id)
+            webhook_queue.task_done()
+
+async def start_webhook_worker() -> None:
+    app.state.webhook_worker = asyncio.create_task(webhook_worker())
+
+async def stop_webhook_worker() -> None:
+    try:
+        await asyncio.wait_for(webhook_queue.join(), timeout=5)
+    except asyncio.TimeoutError:
+        pass
+    app.state.webhook_worker.cancel()
+
+# Lemon Squeezy events are a few KB; anything near this is not a real delivery
+WEBHOOK_MAX_BODY_BYTES = 1 << 20
+# Provider retries of one event arrive within this window and are dropped
+WEBHOOK_DEDUP_TTL_SECONDS = 3600
+
+WEBHOOKS_NOT_CONFIGURED = orjson.dumps({"detail": "Webhooks are not configured"})
+INVALID_SIGNATURE = orjson.dumps({"detail": "Invalid signature"})
+
+async def read_body(request: Request, limit: int) -> bytes:
+    """Read the request body, failing with 413 as soon as it passes `limit` bytes"""
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > limit:
+        raise HTTPException(status_code=413, detail="Request body too large")
+    chunks = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > limit:
+            raise HTTPException(status_code=413, detail="Request body too large")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+@app.post("/api/webhooks/lemonsqueezy")
+async def lemon_squeezy_webhook(request: Request):
+    """Receive Lemon Squeezy billing events (signed with X-Signature)
+
+    The signature is checked on the raw bytes before anything is parsed, so a
+    forged or malformed delivery costs one HMAC and nothing more.
+    """
+    secret = settings.LEMON_SQUEEZY_WEBHOOK_SECRET_BYTES
+    if secret is None:
+        # Without a secret nothing can be verified; never act on unsigned events
+        return json_error(503, WEBHOOKS_NOT_CONFIGURED)
+
+    body = await read_body(request, WEBHOOK_MAX_BODY_BYTES)
+    # X-Signature is the hex HMAC-SHA256 of the body; compare raw digests
+    signature = (request.headers.get("x-signature") or "").removeprefix("sha256=")
+    try:
+        provided_sig = bytes.fromhex(signature)
+    except ValueError:
+        return json_error(401, INVALID_SIGNATURE)
+    if not hmac.compare_digest(hmac.digest(secret, body, "sha256"), provided_sig):
+        return json_error(401, INVALID_SIGNATURE)
+
+    try:
+        event = WebhookPayload(**orjson.loads(body))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Malformed payload")
+    event_name = event.meta.get("event_name")
+    if event_name in SUBSCRIPTION_EVENTS:
+        # A retry re-sends the same signed body, so its hash identifies the event
+        event_id = event.meta.get("event_id") or hashlib.blake2b(body, digest_size=16).hexdigest()
+        if event_id in webhook_pending:
+            return {"received": True, "duplicate": True}
+        # Claimed before the store lookup awaits, so a concurrent retry sees it
+        webhook_pending.add(event_id)
+        queued = False
+        try:
+            if await store.get("webhook_events", event_id) is not None:
+                return {"received": True, "duplicate": True}
+            webhook_queue.put_nowait((event_id, event_name, event.data))
+            queued = True
+        except asyncio.QueueFull:
+            # Lemon Squeezy retries non-2xx deliveries, so nothing is lost
+            raise HTTPException(status_code=503, detail="Webhook queue full, retry later")
+        finally:
+            if not queued:  # the worker releases the claim of a queued event
+                webhook_pending.discard(event_id)
+
+    return {"received": True}
+
+class ClipSourceError(ValueError):
+    """A video_url the server will not fetch; the message is safe to show the caller"""
+
+CLIP_MAX_REDIRECTS = 5
+
+def is_public_address(address: "ipaddress._BaseAddress") -> bool:
+    """Loopback, RFC 1918, link-local (cloud metadata at 169.254.169.254) and
+    other non-global or multicast addresses are not public"""
+    if address.version == 6 and address.ipv4_mapped:
+        address = address.ipv4_mapped
+    return address.is_global and not address.is_multicast
+
+def public_addresses(host: str, port: int) -> List[str]:
+    """Resolve `host`, refusing it unless every address it has is public"""
+    try:
+        resolved = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError:
+        raise ClipSourceError("video_url host could not be resolved")
+    addresses = [sockaddr[0].split("%", 1)[0] for *_, sockaddr in resolved]
+    if not all(is_public_address(ipaddress.ip_address(address)) for address in addresses):
+        raise ClipSourceError("video_url must point to a public host")
+    return addresses
+
+def check_public_url(url: str) -> None:
+    """Refuse anything but http(s) URLs whose host resolves only to public addresses"""
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https") or not parts.hostname:
+        raise ClipSourceError("video_url must be an http(s) URL")
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:  # a malformed port
+        raise ClipSourceError("video_url host could not be resolved")
+    public_addresses(parts.hostname, port)
+
+class PublicAddressConnection:
+    """urllib3 connection mixin: resolve, check and connect in one step
+
+    A name can resolve to a public address for check_public_url and to a
+    private one a moment later (DNS rebinding), so the socket is only ever
+    opened to an address checked here. Host, SNI and certificate checks
+    still use the requested name.
+    """
+
+    def _new_conn(self) -> socket.socket:
+        error: Optional[OSError] = None
+        for address in public_addresses(self._dns_host, self.port):
+            try:
+                return urllib3_connection.create_connection(
+                    (address, self.port), self.timeout,
+                    source_address=self.source_address, socket_options=self.socket_options,
+                )
+            except OSError as e:
+                error = e
+        raise NewConnectionError(self, f"Failed to establish a new connection: {error}")
+
+class PublicHTTPConnection(PublicAddressConnection, HTTPConnection):
+    pass
+
+class PublicHTTPSConnection(PublicAddressConnection, HTTPSConnection):
+    pass
+
+class PublicHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = PublicHTTPConnection
+
+class PublicHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = PublicHTTPSConnection
+
+class PublicAddressAdapter(HTTPAdapter):
+    """requests adapter whose connections only reach public addresses"""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": PublicHTTPConnectionPool,
+            "https": PublicHTTPSConnectionPool,
+        }
+
+def download_video(url: str, path: str, max_bytes: int) -> None:
+    """Stream a public video_url to `path`, at most `max_bytes` of it
+
+    Redirects are followed by hand so every hop passes check_public_url, and
+    the connections themselves only open to checked addresses.
+    """
+    session = requests.Session()
+    session.trust_env = False  # an environment proxy would be the checked peer instead
+    session.mount("http://", PublicAddressAdapter())
+    session.mount("https://", PublicAddressAdapter())
+
+    too_large = ClipSourceError(f"Video exceeds the {max_bytes:,}-byte download limit")
+    with session:
+        for _ in range(CLIP_MAX_REDIRECTS + 1):
+            check_public_url(url)
+            with session.get(url, stream=True, timeout=30, allow_redirects=False) as response:
+                if response.is_redirect:
+                    url = urljoin(url, response.headers["location"])
+                    continue
+                if not response.ok:
+                    raise ClipSourceError(f"video_url returned HTTP {response.status_code}")
+                declared = response.headers.get("content-length", "")
+                if declared.isdigit() and int(declared) > max_bytes:
+                    raise too_large
+                size = 0
+                with open(path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        size += len(chunk)
+                        if size > max_bytes:
+                            raise too_large
+                        f.write(chunk)
+                return
+    raise ClipSourceError("video_url redirected too many times")
+
+# Finished clips are files named after their job, served by download_clip
+CLIP_MEDIA_TYPES = {"mp4": "video/mp4", "mov": "video/quicktime", "mkv": "video/x-matroska"}
+CLIP_FILE_RE = re.compile(r"[A-Za-z0-9_-]{16}\.(?:mp4|mov|mkv)")
+CLIP_SWEEP_INTERVAL_SECONDS = 3600
+
+def clip_output_path(job_id: str, output_format: str) -> Path:
+    return Path(settings.CLIP_OUTPUT_DIR) / f"{job_id}.{output_format}"
+
+def sweep_clip_outputs(max_age: float) -> None:
+    """Delete clip files older than max_age seconds (their job record has expired)"""
+    output_dir = Path(settings.CLIP_OUTPUT_DIR)
+    if not output_dir.is_dir():
+        return
+    cutoff = time.time() - max_age
+    for path in output_dir.iterdir():
+        if not CLIP_FILE_RE.fullmatch(path.name):
+            continue
+        try:
+            if path.stat().st_mtime < cutoff:
+                path.unlink()
+        except OSError:
+            pass  # Already gone, or being replaced; the next sweep retries
+
+async def clip_output_sweeper() -> None:
+    while True:
+        await asyncio.to_thread(sweep_clip_outputs, settings.JOB_TTL_SECONDS)
+        await asyncio.sleep(CLIP_SWEEP_INTERVAL_SECONDS)
+
+async def start_clip_sweeper() -> None:
+    app.state.clip_sweeper = asyncio.create_task(clip_output_sweeper())
+
+async def stop_clip_sweeper() -> None:
+    app.state.clip_sweeper.cancel()
+
+def warm_clip_pipeline() -> None:
+    """Import the pipeline and load + warm the Whisper model (runs in clip_executor)"""
+    import app_enhanced
+    app_enhanced.warm_whisper_model(settings.WHISPER_MODEL)
+
+def _report_warm_failure(future: "asyncio.Future[None]") -> None:
+    if not future.cancelled() and future.exception() is not None:
+        print(f"⚠️  Whisper warm-up failed; the first clip job will load it: {future.exception()}")
+
+async def start_whisper_warmup() -> None:
+    if not settings.WHISPER_WARM_ON_STARTUP:
+        return
+    # Queued on the clip pool rather than awaited: startup is not held up,
+    # and the first job waits behind the load instead of starting another
+    future = asyncio.get_running_loop().run_in_executor(clip_executor, warm_clip_pipeline)
+    future.add_done_callback(_report_warm_failure)
+
+def run_clip_pipeline(job_id: str, video_url: str, query: str, output_format: str,
+                      loop: asyncio.AbstractEventLoop) -> None:
+    """Download, transcribe, select and cut a clip job (runs in clip_executor)"""
+    import app_enhanced
+
+    def update_job(**fields: Any) -> None:
+        fields["updated_at"] = utc_now_iso()
+        asyncio.run_coroutine_threadsafe(
+            store.update("jobs", job_id, ttl=settings.JOB_TTL_SECONDS, **fields), loop
+        ).result()
+
+    output_path = clip_output_path(job_id, output_format)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory(prefix=f"clip-{job_id}-") as work_dir:
+        update_job(status="processing", progress=5, message="Downloading footage...")
+        video_path = os.path.join(work_dir, "input" + (Path(video_url.split("?")[0]).suffix or ".mp4"))
+        download_video(video_url, video_path, settings.CLIP_MAX_DOWNLOAD_BYTES)
+
+        update_job(progress=15, message="Transcribing audio...")
+        transcript = app_enhanced.transcribe_video(video_path, model_name=settings.WHISPER_MODEL)
+
+        update_job(progress=60, message="Analyzing footage...")
+        segments = app_enhanced.get_relevant_segments(transcript, query)
+
+        update_job(progress=75, message="Cutting clips...")
+        app_enhanced.edit_video(
+            video_path, segments, str(output_path),
+            fade_duration=app_enhanced.Config.FADE_DURATION,
+        )
+
+    clip_ready = output_path.exists()
+    update_job(
+        status="completed",
+        progress=100,
+        message="Clip ready." if clip_ready else "No matching moments found.",
+        segments=segments,
+        clip_url=f"/api/jobs/{job_id}/clip" if clip_ready else None,
+    )
+
+async def process_clip_job(job_id: str, video_url: str, query: str, output_format: str) -> None:
+    """Background task: hand the pipeline to the clip pool and record failures"""
+    loop = asyncio.get_running_loop()
+    try:
+        await loop.run_in_executor(
+            clip_executor, run_clip_pipeline, job_id, video_url, query, output_format, loop
+        )
+    except Exception as e:
+        if isinstance(e, ClipSourceError):
+            message = f"Processing failed: {e}"
+        else:
+            # Anything else can carry paths, URLs or ffmpeg stderr: log it, and
+            # give pollers (who need no login) a generic message
+            print(f"⚠️  Clip job {job_id} failed:")
+            traceback.print_exc()
+            message = "Processing failed."
+        clip_output_path(job_id, output_format).unlink(missing_ok=True)
+        await store.update(
+            "jobs", job_id, ttl=settings.JOB_TTL_SECONDS,
+            status="failed", message=message,
+            updated_at=utc_now_iso(),
+        )
+
 @app.post("/api/clip")
-async def create_clip(request: ClipRequest):
+async def create_clip(request: ClipRequest, background_tasks: BackgroundTasks):
     """Create a new clip job"""
-    job_id = secrets.token_hex(8)
+    if not request.video_url:
+        raise HTTPException(status_code=400, detail="video_url must be an http(s) URL")
+    # Checked here for a fast 400, and again per hop when the job downloads
+    try:
+        await asyncio.to_thread(check_public_url, request.video_url)
+    except ClipSourceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if request.output_format not in CLIP_MEDIA_TYPES:
+        raise HTTPException(status_code=400, detail="output_format must be mp4, mov or mkv")
+
+    job_id = secrets.token_urlsafe(12)  # 16 URL-safe chars, 96 random bits
+    now = utc_now_iso()
+    await store.set("jobs", job_id, {
+        "job_id": job_id,
+        "status": "queued",
+        "progress": 0,
+        "query": request.query,
+        "output_format": request.output_format,
+        "message": "Clip job created. Processing will begin shortly.",
+        "created_at": now,
+        "updated_at": now,
+    }, ttl=settings.JOB_TTL_SECONDS)
+    background_tasks.add_task(
+        process_clip_job, job_id, request.video_url, request.query, request.output_format
+    )
     return {
         "job_id": job_id,
         "status": "queued",
@@ -1608,15 +1136,66 @@ async def create_clip(request: ClipRequest):
         "message": "Clip job created. Processing will begin shortly."
     }
 
+JOB_NOT_FOUND = orjson.dumps({"detail": "Job not found"})
+CLIP_NOT_FOUND = orjson.dumps({"detail": "Clip not found"})
+JOB_ID_PATTERN = r"^[A-Za-z0-9_-]{16}$"
+JOB_READ_TTL_SECONDS = 0.25
+
+# job id -> stored JSON (None when missing), reused by polls inside the window
+_job_reads: TTLCache = TTLCache(maxsize=10_000, ttl=JOB_READ_TTL_SECONDS, timer=time.monotonic)
+# job id -> the store read in progress, awaited by every concurrent poll
+_job_reads_inflight: Dict[str, "asyncio.Task[Optional[bytes]]"] = {}
+
+def _finish_job_read(job_id: str, task: "asyncio.Task[Optional[bytes]]") -> None:
+    del _job_reads_inflight[job_id]
+    if not task.cancelled() and task.exception() is None:
+        _job_reads[job_id] = task.result()
+
+async def read_job(job_id: str) -> Optional[bytes]:
+    """Stored JSON for a job, with one store read per job per 250 ms
+
+    Polling storms on one job collapse into a single in-flight read; the
+    shield keeps a client disconnect from cancelling it for the others.
+    """
+    try:
+        return _job_reads[job_id]
+    except KeyError:
+        pass
+    task = _job_reads_inflight.get(job_id)
+    if task is None:
+        task = _job_reads_inflight[job_id] = asyncio.ensure_future(store.get_json("jobs", job_id))
+        task.add_done_callback(lambda done: _finish_job_read(job_id, done))
+    return await asyncio.shield(task)
+
 @app.get("/api/jobs/{job_id}")
-async def get_job_status(job_id: str):
-    """Get the status of a clip job"""
-    return {
-        "job_id": job_id,
-        "status": "processing",
-        "progress": 45,
-        "message": "Analyzing footage..."
-    }
+async def get_job_status(job_id: str = PathParam(pattern=JOB_ID_PATTERN)):
+    """Get the status of a clip job
+
+    Ids are secrets.token_urlsafe(12); anything else is a 422 before the store is
+    touched. Clients poll this, so concurrent polls share one store read
+    (read_job) and the stored JSON is sent as-is instead of being decoded
+    and run back through FastAPI's response encoding.
+    """
+    body = await read_job(job_id)
+    if body is None:
+        return json_error(404, JOB_NOT_FOUND)
+    return Response(body, media_type="application/json")
+
+@app.get("/api/jobs/{job_id}/clip")
+async def download_clip(job_id: str = PathParam(pattern=JOB_ID_PATTERN)):
+    """Download a finished clip (the job's clip_url) until its job record expires
+
+    The unguessable job id is the capability, as for the status endpoint.
+    """
+    job = await store.get("jobs", job_id)
+    if job is None or not job.get("clip_url"):
+        return json_error(404, CLIP_NOT_FOUND)
+    output_format = job["output_format"]
+    path = clip_output_path(job_id, output_format)
+    if not path.is_file():
+        return json_error(404, CLIP_NOT_FOUND)
+    return FileResponse(path, media_type=CLIP_MEDIA_TYPES[output_format],
+                        filename=f"clip-{job_id}.{output_format}")
 
 
 # =============================================================================
@@ -1624,9 +1203,26 @@ async def get_job_status(job_id: str):
 # =============================================================================
 
 if __name__ == "__main__":
+    # Every deploy starts the app this way (Procfile, Dockerfile, railway.toml,
+    # render.yaml). Each worker is a separate process with its own MemoryStore
+    # and webhook queue, so more than one is only safe when state lives in Redis
+    workers = 1
+    if not settings.DEBUG:
+        workers = settings.WEB_WORKERS or os.cpu_count() or 1
+        if workers > 1 and not isinstance(store, RedisStore):
+            print("⚠️  REDIS_URL not set: running a single worker to keep job state consistent")
+            workers = 1
+
+    # uvicorn[standard] installs uvloop and httptools; "auto" selects them
+    # wherever they are available and falls back to asyncio/h11 elsewhere
     uvicorn.run(
-        "web_redesign:app",
+        "web:app",
         host=settings.HOST,
         port=settings.PORT,
+        loop="auto",
+        http="auto",
+        workers=workers,
+        # Per-request log lines cost more than serving a prebuilt page
+        access_log=settings.DEBUG,
         reload=settings.DEBUG
     )